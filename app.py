@@ -1,15 +1,5 @@
-from flask import Flask, request, send_file, jsonify, send_from_directory, render_template
+from flask import Flask, request, send_file, jsonify, send_from_directory, render_template, url_for, make_response, abort, g, has_request_context
 from flask_cors import CORS
-from groq import Groq
-from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-from reportlab.lib.enums import TA_LEFT, TA_CENTER
-from reportlab.lib.colors import HexColor
 import os
 import traceback
 import logging
@@ -17,9 +7,57 @@ import time
 import uuid
 import re
 import json
+import math
+import csv
+import io
+import zipfile
+import abc
+import gzip
+import hashlib
+import hmac
+import importlib
+import mimetypes
+import multiprocessing
+import queue
+import random
+import socket
+import sqlite3
+import sys
+import threading
+import tracemalloc
+from bisect import bisect_left
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from dataclasses import dataclass, field as dataclass_field, fields as dataclass_fields
+from functools import wraps
+from urllib.parse import urlparse
+from xml.sax.saxutils import escape
 from dotenv import load_dotenv
-import requests
-from bs4 import BeautifulSoup
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+# Heavy dependencies (groq, python-docx, reportlab, bs4, pypdf) are imported
+# inside the features that use them, so processes that only serve /health or
+# static pages start quickly. warm_up() preloads them ahead of time.
+HEAVY_MODULES = [
+    'groq',
+    'docx',
+    'docx.shared',
+    'docx.enum.text',
+    'reportlab.lib.pagesizes',
+    'reportlab.lib.styles',
+    'reportlab.lib.units',
+    'reportlab.platypus',
+    'reportlab.lib.enums',
+    'reportlab.lib.colors',
+    'bs4',
+    'pypdf',
+]
+
+try:
+    import brotli  # Optional: enables precompressed .br variants of static assets
+except ImportError:
+    brotli = None
 
 # Load environment variables
 load_dotenv()
@@ -42,26 +80,1015 @@ CORS(app, resources={
     }
 })
 
+# Number of reverse proxies in front of the app whose X-Forwarded-For and
+# X-Forwarded-Proto headers are trusted. Leave at 0 when clients connect
+# directly, otherwise they could spoof their address.
+TRUSTED_PROXY_HOPS = int(os.getenv('TRUSTED_PROXY_HOPS', '0'))
+if TRUSTED_PROXY_HOPS > 0:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXY_HOPS, x_proto=TRUSTED_PROXY_HOPS)
+
 # Groq API Configuration
 GROQ_API_KEY = os.getenv('GROQ_API_KEY', '')
 GROQ_MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
 
-# Initialize Groq client
+# Groq client, created on first use by get_groq_client()
 client = None
-if GROQ_API_KEY:
+client_lock = threading.Lock()
+if not GROQ_API_KEY:
+    logger.error("No GROQ_API_KEY found")
+
+
+def get_groq_client():
+    """Return the shared Groq client, creating it on first use.
+
+    Returns None when no API key is configured or initialization fails.
+    """
+    global client
+    if client is None and GROQ_API_KEY:
+        with client_lock:
+            if client is None:
+                try:
+                    from groq import Groq
+                    # Retries are handled by call sites within the request deadline
+                    client = Groq(api_key=GROQ_API_KEY, max_retries=0)
+                except Exception as e:
+                    logger.error(f"Groq client initialization failed: {e}")
+    return client
+
+
+def check_groq_connection():
+    """Send a minimal request to verify the API key and model."""
+    groq_client = get_groq_client()
+    if not groq_client:
+        return False
     try:
-        client = Groq(api_key=GROQ_API_KEY)
-        test_response = client.chat.completions.create(
+        groq_client.chat.completions.create(
             model=GROQ_MODEL,
             messages=[{"role": "user", "content": "test"}],
-            max_tokens=5
+            max_tokens=5,
+            timeout=10
         )
         logger.info(f"Groq API connected successfully with model: {GROQ_MODEL}")
+        return True
     except Exception as e:
         logger.error(f"Groq API connection failed: {e}")
-        client = None
-else:
-    logger.error("No GROQ_API_KEY found")
+        return False
+
+
+def warm_up(check_connection=False):
+    """Preload heavy dependencies and the Groq client.
+
+    Call before forking workers (e.g. from a gunicorn --preload config, or by
+    setting PRELOAD_DEPENDENCIES=1) so that children share the imported
+    modules and the first request does not pay the import cost.
+    """
+    started = time.perf_counter()
+    for name in HEAVY_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            logger.warning(f"Warm-up could not import {name}: {e}")
+    get_groq_client()
+    if check_connection:
+        check_groq_connection()
+    logger.info(f"Warm-up finished in {(time.perf_counter() - started) * 1000:.0f}ms")
+
+
+# -----------------------------------------------------------------------------
+# LLM upstream protection: circuit breaker and request deadlines
+# Every Groq call goes through call_llm(), which fails fast while the breaker
+# is open and never waits past the deadline of the request it serves.
+# -----------------------------------------------------------------------------
+LLM_FAILURE_THRESHOLD = int(os.getenv('LLM_FAILURE_THRESHOLD', '5'))
+LLM_SLOW_CALL_SECONDS = float(os.getenv('LLM_SLOW_CALL_SECONDS', '15'))
+LLM_RESET_TIMEOUT = float(os.getenv('LLM_RESET_TIMEOUT', '30'))
+LLM_REQUEST_BUDGET = float(os.getenv('LLM_REQUEST_BUDGET', '30'))
+LLM_MIN_CALL_SECONDS = 1.0  # Not worth starting a call with less time than this
+
+
+class LLMUnavailableError(RuntimeError):
+    """The LLM upstream cannot serve this request."""
+    status_code = 503
+    status = "llm_unavailable"
+    retry_after = None
+
+
+class CircuitOpenError(LLMUnavailableError):
+    """Raised without calling upstream while the circuit breaker is open."""
+
+    def __init__(self, retry_after):
+        super().__init__("AI service is temporarily unavailable, please retry shortly")
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(LLMUnavailableError):
+    """The request's time budget ran out before the LLM could answer."""
+    status_code = 504
+    status = "deadline_exceeded"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with half-open probing.
+
+    Calls slower than `slow_call_seconds` count as failures, so a degraded
+    upstream trips the breaker as well as a dead one. After `reset_timeout`
+    seconds one probe call is let through; its outcome closes or re-opens
+    the circuit.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold=5, slow_call_seconds=15.0, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._last_outcome = None  # "success", "client_error" or "failure" of the latest call
+        self._last_call_at = 0.0
+
+    @property
+    def state(self):
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def before_call(self):
+        """Raise CircuitOpenError unless a call may go upstream now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            waited = time.monotonic() - self._opened_at
+            if self._state == self.OPEN and waited >= self.reset_timeout:
+                self._state = self.HALF_OPEN
+            if self._state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                logger.info("Circuit breaker half-open, sending probe")
+                return
+            raise CircuitOpenError(retry_after=max(self.reset_timeout - waited, 1.0))
+
+    def record_success(self, latency, outcome="success"):
+        if latency > self.slow_call_seconds:
+            logger.warning(f"Slow LLM call ({latency:.1f}s) counted as failure")
+            self.record_failure()
+            return
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Circuit breaker closed, LLM traffic restored")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+            self._last_outcome, self._last_call_at = outcome, time.monotonic()
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            self._last_outcome, self._last_call_at = "failure", time.monotonic()
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.error(f"Circuit breaker opened after {self._failures} consecutive failures")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def snapshot(self):
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "last_call": self._last_outcome,
+                "last_call_seconds_ago": (round(time.monotonic() - self._last_call_at, 1)
+                                          if self._last_outcome else None)
+            }
+
+
+llm_breaker = CircuitBreaker(LLM_FAILURE_THRESHOLD, LLM_SLOW_CALL_SECONDS, LLM_RESET_TIMEOUT)
+
+
+@app.before_request
+def set_request_deadline():
+    """Give every request an overall time budget, optionally shortened by the client."""
+    budget = LLM_REQUEST_BUDGET
+    requested = request.headers.get('X-Request-Timeout')
+    if requested:
+        try:
+            budget = min(budget, max(float(requested), 0.0))
+        except ValueError:
+            pass
+    g.deadline = time.monotonic() + budget
+
+
+def request_deadline():
+    """Deadline of the current request, or a fresh budget outside a request."""
+    if has_request_context() and g.get('deadline'):
+        return g.deadline
+    return time.monotonic() + LLM_REQUEST_BUDGET
+
+
+def call_llm(messages, deadline=None, **params):
+    """Send a chat completion through the circuit breaker within the deadline."""
+    groq_client = get_groq_client()
+    if not groq_client:
+        raise LLMUnavailableError("AI service is not configured")
+
+    deadline = deadline or request_deadline()
+    remaining = deadline - time.monotonic()
+    if remaining < LLM_MIN_CALL_SECONDS:
+        raise DeadlineExceeded("Request deadline exceeded before the AI service could respond")
+
+    llm_breaker.before_call()
+    started = time.monotonic()
+    try:
+        response = groq_client.chat.completions.create(
+            model=GROQ_MODEL,
+            messages=messages,
+            timeout=remaining,
+            **params
+        )
+    except Exception as e:
+        # Client errors (bad request, auth) say nothing about upstream health
+        status = getattr(e, 'status_code', None)
+        if isinstance(status, int) and status < 500 and status != 429:
+            llm_breaker.record_success(time.monotonic() - started, outcome="client_error")
+            raise
+        llm_breaker.record_failure()
+        unavailable = translate_llm_error(e)
+        if unavailable is None:
+            raise
+        raise unavailable from e
+    llm_breaker.record_success(time.monotonic() - started)
+    return response
+
+
+def translate_llm_error(error):
+    """Map a timeout or upstream failure from the Groq SDK to an LLMUnavailableError.
+
+    Returns None for anything else, which the caller re-raises unchanged.
+    """
+    from groq import APIConnectionError, APIStatusError, APITimeoutError
+
+    if isinstance(error, (APITimeoutError, TimeoutError)):
+        return DeadlineExceeded("AI service did not respond within the request deadline")
+    if isinstance(error, APIStatusError):
+        unavailable = LLMUnavailableError(f"AI service returned HTTP {error.status_code}")
+        retry_after = error.response.headers.get('retry-after')
+        if retry_after:
+            try:
+                unavailable.retry_after = float(retry_after)
+            except ValueError:
+                pass
+        return unavailable
+    if isinstance(error, APIConnectionError):
+        return LLMUnavailableError("Cannot reach the AI service")
+    return None
+
+
+def llm_error_response(error):
+    """JSON error response for an LLMUnavailableError, with Retry-After when known."""
+    response = jsonify({
+        "error": str(error),
+        "status": error.status,
+        "circuit": llm_breaker.state
+    })
+    response.status_code = error.status_code
+    if error.retry_after:
+        response.headers['Retry-After'] = str(math.ceil(error.retry_after))
+    return response
+
+
+# -----------------------------------------------------------------------------
+# Request scheduler
+# Routes are tagged with a priority class. Each class has its own concurrency
+# limit and all classes share a pool of slots; freed slots go to the highest
+# priority class with waiters, and within a class clients are served
+# round-robin so one client's burst cannot monopolize it.
+# -----------------------------------------------------------------------------
+SCHEDULER_TOTAL_SLOTS = int(os.getenv('SCHEDULER_TOTAL_SLOTS', '10'))
+
+# Lower priority number wins. Limits of the non-interactive classes add up to
+# less than the total, so interactive requests always keep some slots.
+SCHEDULER_CLASSES = {
+    "interactive": {"priority": 0, "limit": 8, "max_wait": 10.0},
+    "analysis": {"priority": 1, "limit": 3, "max_wait": 20.0},
+    "rendering": {"priority": 2, "limit": 2, "max_wait": 20.0},
+    "bulk": {"priority": 3, "limit": 1, "max_wait": 30.0},
+}
+SCHEDULER_WAIT_SAMPLES = 500
+
+
+class _PriorityClass:
+    def __init__(self, name, priority, limit, max_wait):
+        self.name = name
+        self.priority = priority
+        self.limit = limit
+        self.max_wait = max_wait
+        self.running = 0
+        self.queues = {}           # client id -> deque of waiting events
+        self.rotation = deque()    # client ids with waiters, in round-robin order
+        self.queued = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.waits = deque(maxlen=SCHEDULER_WAIT_SAMPLES)
+
+
+class RequestScheduler:
+    """Priority- and fairness-aware admission control for request handlers."""
+
+    def __init__(self, classes, total_slots):
+        self.total_slots = total_slots
+        self.running = 0
+        self._lock = threading.Lock()
+        self._classes = {
+            name: _PriorityClass(name, cfg["priority"], cfg["limit"], cfg["max_wait"])
+            for name, cfg in classes.items()
+        }
+        self._by_priority = sorted(self._classes.values(), key=lambda c: c.priority)
+
+    def _has_capacity(self, cls):
+        return cls.running < cls.limit and self.running < self.total_slots
+
+    def acquire(self, class_name, client_id, deadline=None):
+        """Wait for a slot. Returns False if none frees up in time."""
+        cls = self._classes[class_name]
+        started = time.monotonic()
+        with self._lock:
+            if cls.queued == 0 and self._has_capacity(cls):
+                cls.running += 1
+                self.running += 1
+                cls.waits.append(0.0)
+                return True
+
+            event = threading.Event()
+            if client_id not in cls.queues:
+                cls.queues[client_id] = deque()
+                cls.rotation.append(client_id)
+            cls.queues[client_id].append(event)
+            cls.queued += 1
+            cls.max_queued = max(cls.max_queued, cls.queued)
+
+        timeout = cls.max_wait
+        if deadline:
+            timeout = min(timeout, max(deadline - started, 0.0))
+
+        if event.wait(timeout):
+            with self._lock:
+                cls.waits.append(time.monotonic() - started)
+            return True
+
+        with self._lock:
+            if event.is_set():  # Granted just as the wait timed out
+                cls.waits.append(time.monotonic() - started)
+                return True
+            queue = cls.queues[client_id]
+            queue.remove(event)
+            if not queue:
+                del cls.queues[client_id]
+                cls.rotation.remove(client_id)
+            cls.queued -= 1
+            cls.rejected += 1
+        return False
+
+    def release(self, class_name):
+        with self._lock:
+            cls = self._classes[class_name]
+            cls.running -= 1
+            cls.completed += 1
+            self.running -= 1
+            self._dispatch()
+
+    def _dispatch(self):
+        """Hand freed slots to waiters, highest priority class first."""
+        for cls in self._by_priority:
+            while cls.queued and self._has_capacity(cls):
+                client_id = cls.rotation.popleft()
+                queue = cls.queues[client_id]
+                event = queue.popleft()
+                if queue:
+                    cls.rotation.append(client_id)
+                else:
+                    del cls.queues[client_id]
+                cls.queued -= 1
+                cls.running += 1
+                self.running += 1
+                event.set()
+
+    def stats(self):
+        with self._lock:
+            classes = {}
+            for cls in self._by_priority:
+                waits = sorted(cls.waits)
+                classes[cls.name] = {
+                    "priority": cls.priority,
+                    "limit": cls.limit,
+                    "running": cls.running,
+                    "queue_depth": cls.queued,
+                    "max_queue_depth": cls.max_queued,
+                    "queued_clients": len(cls.queues),
+                    "completed": cls.completed,
+                    "rejected": cls.rejected,
+                    "wait_ms_avg": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+                    "wait_ms_p95": round(waits[int(len(waits) * 0.95)] * 1000, 1) if waits else 0.0,
+                    "wait_ms_max": round(waits[-1] * 1000, 1) if waits else 0.0
+                }
+            return {"total_slots": self.total_slots, "running": self.running, "classes": classes}
+
+
+scheduler = RequestScheduler(SCHEDULER_CLASSES, SCHEDULER_TOTAL_SLOTS)
+
+
+def client_id():
+    """Identify the requesting client for fair queuing and rate limits."""
+    return request.remote_addr or 'unknown'
+
+
+def scheduled(class_name):
+    """Run a route under the scheduler in the given priority class."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            requester = client_id()
+            if not scheduler.acquire(class_name, requester, g.get('deadline')):
+                logger.warning(f"Scheduler rejected {request.endpoint} ({class_name}) for {requester}")
+                response = jsonify({
+                    "error": "Server is busy, please retry shortly",
+                    "status": "overloaded",
+                    "class": class_name
+                })
+                response.status_code = 503
+                response.headers['Retry-After'] = '2'
+                return response
+            try:
+                return func(*args, **kwargs)
+            finally:
+                scheduler.release(class_name)
+        return wrapper
+    return decorator
+
+
+LLM_RATE_LIMIT_PER_MINUTE = int(os.getenv('LLM_RATE_LIMIT_PER_MINUTE', '60'))
+
+
+def rate_limited(scope, limit=LLM_RATE_LIMIT_PER_MINUTE, window=60):
+    """Limit each client to `limit` calls per `window` seconds, counted in the shared state backend."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if limit <= 0:
+                return func(*args, **kwargs)
+            try:
+                count = state.incr(f"ratelimit:{scope}:{client_id()}", window)
+            except StateBackendError as e:
+                # Fail open: an unreachable backend must not take the app down
+                logger.warning(f"Rate limit check failed: {e}")
+                count = 0
+            if count > limit:
+                response = jsonify({
+                    "error": "Too many requests, please slow down",
+                    "status": "rate_limited"
+                })
+                response.status_code = 429
+                response.headers['Retry-After'] = str(window - int(time.time()) % window)
+                return response
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# -----------------------------------------------------------------------------
+# Diagnostics: sampling profiler and allocation tracing
+# Both are opt-in and controlled through the admin endpoints below. While
+# disabled, the per-request cost is a single float comparison.
+# -----------------------------------------------------------------------------
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN', '')
+PROFILE_SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', '0'))
+PROFILE_INTERVAL = float(os.getenv('PROFILE_INTERVAL_MS', '5')) / 1000
+ALLOCATION_TOP_N = 15
+ALLOCATION_HISTORY = 20
+
+
+class SamplingProfiler:
+    """Periodically samples the stacks of selected request threads.
+
+    Stacks are aggregated per endpoint in the folded format understood by
+    flamegraph.pl and speedscope ("frame;frame;frame count").
+    """
+
+    def __init__(self, sample_rate=0.0, interval=0.005):
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._threads = {}  # thread id -> endpoint being profiled
+        self._stacks = {}   # endpoint -> Counter of folded stacks
+        self._requests = Counter()
+        self._sampler = None
+
+    def should_sample(self):
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def attach(self, endpoint):
+        """Start sampling the current thread on behalf of an endpoint."""
+        with self._lock:
+            self._threads[threading.get_ident()] = endpoint
+            self._requests[endpoint] += 1
+            if self._sampler is None or not self._sampler.is_alive():
+                self._sampler = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+                self._sampler.start()
+
+    def detach(self):
+        with self._lock:
+            self._threads.pop(threading.get_ident(), None)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._threads:
+                    self._sampler = None
+                    return
+                targets = dict(self._threads)
+
+            frames = sys._current_frames()
+            for thread_id, endpoint in targets.items():
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                    frame = frame.f_back
+                folded = ';'.join(reversed(stack))
+                with self._lock:
+                    self._stacks.setdefault(endpoint, Counter())[folded] += 1
+
+            time.sleep(self.interval)
+
+    def folded(self, endpoint=None):
+        """Return collected samples in folded-stack text format."""
+        with self._lock:
+            endpoints = [endpoint] if endpoint else sorted(self._stacks)
+            lines = []
+            for name in endpoints:
+                for stack, count in self._stacks.get(name, Counter()).most_common():
+                    lines.append(f"{name};{stack} {count}")
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def stats(self):
+        with self._lock:
+            return {
+                "sample_rate": self.sample_rate,
+                "interval_ms": self.interval * 1000,
+                "profiled_requests": dict(self._requests),
+                "samples": {name: sum(c.values()) for name, c in self._stacks.items()}
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stacks.clear()
+            self._requests.clear()
+
+
+profiler = SamplingProfiler(PROFILE_SAMPLE_RATE, PROFILE_INTERVAL)
+
+# label -> recent allocation diffs, newest last
+allocation_reports = {}
+allocation_lock = threading.Lock()
+
+
+def _record_allocations(label, before, started):
+    try:
+        after = tracemalloc.take_snapshot()
+    except RuntimeError:
+        return  # Tracing was switched off while the block was running
+    diff = after.compare_to(before, 'lineno')
+    report = {
+        "timestamp": time.time(),
+        "duration_ms": round((time.perf_counter() - started) * 1000, 2),
+        "size_diff_bytes": sum(stat.size_diff for stat in diff),
+        "top": [
+            {
+                "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "size_diff_bytes": stat.size_diff,
+                "count_diff": stat.count_diff
+            }
+            for stat in diff[:ALLOCATION_TOP_N]
+        ]
+    }
+    with allocation_lock:
+        allocation_reports.setdefault(label, deque(maxlen=ALLOCATION_HISTORY)).append(report)
+
+
+@contextmanager
+def allocation_trace(label):
+    """Record the allocation delta of a block while tracemalloc is running."""
+    if not tracemalloc.is_tracing():
+        yield
+        return
+
+    before = tracemalloc.take_snapshot()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        # /admin/allocations may have stopped tracing in the meantime
+        if tracemalloc.is_tracing():
+            _record_allocations(label, before, started)
+
+
+def traced_allocations(label):
+    """Decorator form of allocation_trace()."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with allocation_trace(label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def admin_required(func):
+    """Restrict an endpoint to callers presenting the ADMIN_TOKEN.
+
+    The endpoints are hidden entirely (404) when no token is configured.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not ADMIN_TOKEN:
+            abort(404)
+        supplied = request.headers.get('X-Admin-Token', '')
+        if not hmac.compare_digest(supplied.encode(), ADMIN_TOKEN.encode()):
+            return jsonify({"error": "Forbidden"}), 403
+        return func(*args, **kwargs)
+    return wrapper
+
+
+@app.before_request
+def start_request_profiling():
+    """Attach the sampling profiler to a random fraction of requests."""
+    if profiler.sample_rate and profiler.should_sample():
+        g.profiled = True
+        profiler.attach(request.endpoint or request.path)
+
+
+@app.teardown_request
+def stop_request_profiling(exc=None):
+    if g.pop('profiled', False):
+        profiler.detach()
+
+
+class LRUCache:
+    """Small thread-safe in-memory LRU cache."""
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self):
+        return len(self._data)
+
+
+# -----------------------------------------------------------------------------
+# Shared state backend
+# Generated resumes, LLM result caches and rate-limit counters live behind
+# StateBackend so several nodes can share them. STATE_BACKEND selects the
+# implementation: "local" (files + SQLite, shared by workers on one host) or
+# "redis" (any Redis-protocol server, shared across hosts).
+# -----------------------------------------------------------------------------
+STATE_BACKEND = os.getenv('STATE_BACKEND', 'local').lower()
+ARTIFACT_DIR = os.getenv('ARTIFACT_DIR', 'generated')
+STATE_DB_PATH = os.getenv('STATE_DB_PATH', os.path.join(ARTIFACT_DIR, 'state.db'))
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+STATE_KEY_PREFIX = os.getenv('STATE_KEY_PREFIX', 'resume:')
+ARTIFACT_TTL = int(os.getenv('ARTIFACT_TTL', str(24 * 60 * 60)))
+ARTIFACT_NAME_RE = re.compile(r'Resume_[0-9a-f]{8}\.(?:docx|pdf)')
+
+
+class StateBackendError(RuntimeError):
+    """The shared state backend could not complete an operation."""
+
+
+class StateBackend(abc.ABC):
+    """Interface for state that must be shared between app nodes.
+
+    Artifacts are described by {"name", "kind", "etag", "created_at"} dicts
+    and are only ever looked up by their unguessable name.
+    """
+
+    name = "base"
+
+    @abc.abstractmethod
+    def save_artifact(self, path, kind):
+        """Store a rendered file and return its metadata."""
+
+    @abc.abstractmethod
+    def artifact_info(self, name):
+        """Return an artifact's metadata, or None if it does not exist or expired."""
+
+    @abc.abstractmethod
+    def open_artifact(self, name):
+        """Return a binary file object with the artifact, or None if it no longer exists."""
+
+    @abc.abstractmethod
+    def cache_get(self, key):
+        """Return a cached string, or None on a miss."""
+
+    @abc.abstractmethod
+    def cache_set(self, key, value, ttl):
+        """Cache a string for `ttl` seconds."""
+
+    @abc.abstractmethod
+    def incr(self, key, window):
+        """Count a hit in the current fixed window of `window` seconds; return the count."""
+
+    @staticmethod
+    def _artifact_meta(path, kind):
+        with open(path, 'rb') as f:
+            data = f.read()
+        return {
+            "name": os.path.basename(path),
+            "kind": kind,
+            "etag": hashlib.sha256(data).hexdigest()[:32],
+            "created_at": time.time()
+        }, data
+
+
+class LocalStateBackend(StateBackend):
+    """Artifacts on the local filesystem, everything else in SQLite."""
+
+    name = "local"
+
+    PURGE_INTERVAL = 60  # Seconds between sweeps for expired artifacts
+
+    def __init__(self, artifact_dir, db_path, artifact_ttl=ARTIFACT_TTL):
+        self.artifact_dir = artifact_dir
+        self.db_path = db_path
+        self.artifact_ttl = artifact_ttl
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._last_purge = 0.0
+        self._db = None
+        self._db_pid = None
+
+    def _connection(self):
+        """Open the database on first use in each process.
+
+        SQLite handles must not cross fork(), so workers forked from a
+        preloaded master (gunicorn --preload) each open their own.
+        """
+        if self._db is None or self._db_pid != os.getpid():
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            db = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript("""
+                CREATE TABLE IF NOT EXISTS artifacts (
+                    name TEXT PRIMARY KEY, kind TEXT NOT NULL, etag TEXT NOT NULL, created_at REAL NOT NULL);
+                CREATE INDEX IF NOT EXISTS artifacts_created ON artifacts (created_at);
+                CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL);
+                CREATE TABLE IF NOT EXISTS counters (key TEXT PRIMARY KEY, count INTEGER NOT NULL, expires_at REAL NOT NULL);
+            """)
+            self._db, self._db_pid = db, os.getpid()
+        return self._db
+
+    @contextmanager
+    def _locked_db(self):
+        """Serialize access to the connection and surface SQLite failures as StateBackendError."""
+        with self._lock:
+            try:
+                yield self._connection()
+            except (sqlite3.Error, OSError) as e:
+                raise StateBackendError(f"SQLite state backend failed: {e}") from e
+
+    def _query(self, sql, params=()):
+        with self._locked_db() as db:
+            return db.execute(sql, params).fetchone()
+
+    def _write(self, sql, params=()):
+        with self._locked_db() as db:
+            db.execute(sql, params)
+            self._writes += 1
+            if self._writes % 500 == 0:
+                now = time.time()
+                db.execute("DELETE FROM cache WHERE expires_at < ?", (now,))
+                db.execute("DELETE FROM counters WHERE expires_at < ?", (now,))
+
+    def save_artifact(self, path, kind):
+        meta, _ = self._artifact_meta(path, kind)
+        target = os.path.join(self.artifact_dir, meta["name"])
+        if os.path.abspath(path) != os.path.abspath(target):
+            os.makedirs(self.artifact_dir, exist_ok=True)
+            os.replace(path, target)
+        self._write("INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?)",
+                    (meta["name"], kind, meta["etag"], meta["created_at"]))
+        if meta["created_at"] - self._last_purge > self.PURGE_INTERVAL:
+            self._purge_artifacts()
+        return meta
+
+    def _purge_artifacts(self):
+        """Delete artifacts older than the TTL, rows and files alike."""
+        cutoff = time.time() - self.artifact_ttl
+        with self._locked_db() as db:
+            self._last_purge = time.time()
+            names = [row[0] for row in db.execute("SELECT name FROM artifacts WHERE created_at < ?", (cutoff,))]
+            db.execute("DELETE FROM artifacts WHERE created_at < ?", (cutoff,))
+        for name in names:
+            try:
+                os.remove(os.path.join(self.artifact_dir, name))
+            except FileNotFoundError:
+                pass
+        if names:
+            logger.info(f"Purged {len(names)} expired artifacts")
+
+    def _row_to_meta(self, row):
+        return dict(zip(("name", "kind", "etag", "created_at"), row)) if row else None
+
+    def artifact_info(self, name):
+        return self._row_to_meta(self._query(
+            "SELECT * FROM artifacts WHERE name = ? AND created_at >= ?", (name, time.time() - self.artifact_ttl)))
+
+    def open_artifact(self, name):
+        # Opened rather than read, so send_file streams it from disk
+        try:
+            return open(os.path.join(self.artifact_dir, name), 'rb')
+        except FileNotFoundError:
+            return None
+
+    def cache_get(self, key):
+        row = self._query("SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time()))
+        return row[0] if row else None
+
+    def cache_set(self, key, value, ttl):
+        self._write("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", (key, value, time.time() + ttl))
+
+    def incr(self, key, window):
+        now = time.time()
+        bucket = f"{key}:{int(now // window)}"
+        with self._locked_db() as db:
+            db.execute(
+                "INSERT INTO counters VALUES (?, 1, ?) ON CONFLICT(key) DO UPDATE SET count = count + 1",
+                (bucket, now + window))
+            return db.execute("SELECT count FROM counters WHERE key = ?", (bucket,)).fetchone()[0]
+
+
+class RespClient:
+    """Minimal Redis protocol (RESP2) client with a small connection pool.
+
+    Avoids a hard dependency on redis-py; works with Redis, Valkey, KeyDB or
+    any stand-in speaking the same protocol.
+    """
+
+    def __init__(self, url, timeout=2.0, pool_size=16):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or 'localhost'
+        self.port = parsed.port or 6379
+        self.username = parsed.username
+        self.password = parsed.password
+        self.db = int(parsed.path.lstrip('/') or 0)
+        self.timeout = timeout
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+
+    def _connect(self):
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        conn = (sock, sock.makefile('rb'))
+        if self.password:
+            self._command(conn, *(['AUTH', self.username] if self.username else ['AUTH']), self.password)
+        if self.db:
+            self._command(conn, 'SELECT', self.db)
+        return conn
+
+    @staticmethod
+    def _encode(args):
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode()
+            parts.append(f"${len(arg)}\r\n".encode() + arg + b"\r\n")
+        return b"".join(parts)
+
+    def _read_reply(self, reader):
+        line = reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by state backend")
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b'+':
+            return payload.decode()
+        if prefix == b'-':
+            raise StateBackendError(payload.decode())
+        if prefix == b':':
+            return int(payload)
+        if prefix == b'$':
+            length = int(payload)
+            return None if length < 0 else reader.read(length + 2)[:-2]
+        if prefix == b'*':
+            length = int(payload)
+            return None if length < 0 else [self._read_reply(reader) for _ in range(length)]
+        raise ConnectionError(f"Unexpected reply from state backend: {line[:20]!r}")
+
+    def _command(self, conn, *args):
+        conn[0].sendall(self._encode(args))
+        return self._read_reply(conn[1])
+
+    def execute(self, *args):
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            try:
+                conn = self._connect()
+            except OSError as e:
+                raise StateBackendError(f"Cannot connect to {self.host}:{self.port}: {e}") from e
+
+        try:
+            reply = self._command(conn, *args)
+        except StateBackendError:
+            self._release(conn)
+            raise
+        except (OSError, ValueError) as e:
+            conn[1].close()
+            conn[0].close()
+            raise StateBackendError(f"State backend connection failed: {e}") from e
+
+        self._release(conn)
+        return reply
+
+    def _release(self, conn):
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn[1].close()
+            conn[0].close()
+
+
+class RedisStateBackend(StateBackend):
+    """All state in a Redis-protocol server, with expiry on every key."""
+
+    name = "redis"
+
+    def __init__(self, url, prefix='resume:', artifact_ttl=ARTIFACT_TTL):
+        self.redis = RespClient(url)
+        self.prefix = prefix
+        self.artifact_ttl = artifact_ttl
+
+    def _key(self, *parts):
+        return self.prefix + ':'.join(parts)
+
+    def save_artifact(self, path, kind):
+        meta, data = self._artifact_meta(path, kind)
+        ttl = self.artifact_ttl
+        self.redis.execute('SET', self._key('artifact', meta["name"]), data, 'EX', ttl)
+        self.redis.execute('SET', self._key('artifact-meta', meta["name"]), json.dumps(meta), 'EX', ttl)
+        os.remove(path)  # The local render is no longer needed
+        return meta
+
+    def artifact_info(self, name):
+        raw = self.redis.execute('GET', self._key('artifact-meta', name))
+        return json.loads(raw) if raw else None
+
+    def open_artifact(self, name):
+        data = self.redis.execute('GET', self._key('artifact', name))
+        return io.BytesIO(data) if data is not None else None
+
+    def cache_get(self, key):
+        value = self.redis.execute('GET', self._key('cache', key))
+        return value.decode() if value is not None else None
+
+    def cache_set(self, key, value, ttl):
+        self.redis.execute('SET', self._key('cache', key), value, 'EX', int(ttl))
+
+    def incr(self, key, window):
+        bucket = self._key('counter', key, str(int(time.time() // window)))
+        count = self.redis.execute('INCR', bucket)
+        if count == 1:
+            self.redis.execute('EXPIRE', bucket, window)
+        return count
+
+
+def create_state_backend():
+    if STATE_BACKEND == 'redis':
+        logger.info(f"Using Redis state backend at {urlparse(REDIS_URL).hostname}")
+        return RedisStateBackend(REDIS_URL, STATE_KEY_PREFIX)
+    return LocalStateBackend(ARTIFACT_DIR, STATE_DB_PATH, ARTIFACT_TTL)
+
+
+state = create_state_backend()
 
 
 # Resume Enhancement Prompts
@@ -239,10 +1266,270 @@ resume_prompts = {
         "   ---\n"
         "10. Return ONLY the enhanced project content; do NOT include explanations, commentary, or extra text.\n"
         "Notes: Follow all Global Resume Rules and best practices for professional project presentation."
+    ),
+    "project_item": (
+        "Role: Expert Resume Consultant & Project Portfolio Strategist\n"
+        "Objective: Enhance a single resume project for clarity, relevance, and measurable impact.\n"
+        "Instructions:\n"
+        "1. Enhance the title so it is clear and professional; keep it short.\n"
+        "2. Rewrite the description in 2–3 sentences covering purpose, scope, key technologies, and contributions.\n"
+        "3. Use strong action verbs and quantify achievements where the input supports it.\n"
+        "4. Tailor language to ATS-relevant keywords without inventing facts.\n"
+        "5. Return ONLY a JSON object of the form {\"title\": \"...\", \"description\": \"...\"} with no other text.\n"
+        "Notes: Follow all Global Resume Rules."
     )
 }
 
 
+# Canonical skills with their true synonyms and acronyms, used for local
+# autocomplete and normalization without an LLM round trip. Normalization
+# rewrites an alias to its canonical name, so only list terms that mean
+# exactly the same thing; related tools and broader or narrower terms
+# belong in SKILL_RELATED.
+SKILL_CATALOG = {
+    # Programming languages
+    "Python": ["py", "python3"],
+    "JavaScript": ["js", "ecmascript", "es6"],
+    "TypeScript": ["ts"],
+    "Java": ["java se", "java ee"],
+    "C++": ["cpp", "c plus plus"],
+    "C#": ["c sharp", "csharp"],
+    "C": ["c language"],
+    "Go": ["golang"],
+    "Rust": ["rust lang"],
+    "Ruby": ["rb"],
+    "PHP": ["php7", "php8"],
+    "Kotlin": ["kt"],
+    "Swift": ["swift lang"],
+    "R": ["r language", "r programming"],
+    "MATLAB": ["matlab"],
+    "Scala": ["scala"],
+    "Bash": ["bash scripting"],
+    "SQL": ["structured query language"],
+    "HTML5": ["html", "hypertext markup language"],
+    "CSS3": ["css", "cascading style sheets"],
+
+    # Frameworks and libraries
+    "React": ["react.js", "reactjs"],
+    "Angular": ["angularjs", "angular.js"],
+    "Vue.js": ["vue", "vuejs"],
+    "Next.js": ["nextjs", "next"],
+    "Node.js": ["node", "nodejs"],
+    "Express.js": ["express", "expressjs"],
+    "Django": ["django framework"],
+    "Flask": ["flask"],
+    "FastAPI": ["fast api"],
+    "Spring Boot": ["springboot", "spring-boot"],
+    ".NET": ["dotnet", "dot net"],
+    "Ruby on Rails": ["rails", "ror"],
+    "Tailwind CSS": ["tailwind", "tailwindcss"],
+    "Bootstrap": ["bootstrap css"],
+    "jQuery": ["jquery"],
+    "Redux": ["redux.js"],
+    "GraphQL": ["gql"],
+    "REST APIs": ["rest", "restful apis", "restful", "rest api"],
+    "TensorFlow": ["tf", "tensorflow"],
+    "PyTorch": ["torch"],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "Pandas": ["pandas"],
+    "NumPy": ["numpy"],
+
+    # Data and infrastructure
+    "PostgreSQL": ["postgres", "psql"],
+    "MySQL": ["mysql"],
+    "MongoDB": ["mongo"],
+    "Redis": ["redis"],
+    "Elasticsearch": ["elastic search"],
+    "Apache Kafka": ["kafka"],
+    "Apache Spark": ["spark"],
+    "Amazon Web Services (AWS)": ["aws", "amazon web services"],
+    "Microsoft Azure": ["azure"],
+    "Google Cloud Platform (GCP)": ["gcp", "google cloud"],
+    "Docker": ["docker containers"],
+    "Kubernetes": ["k8s", "kube"],
+    "Terraform": ["hashicorp terraform"],
+    "Continuous Integration/Continuous Deployment (CI/CD)": ["ci/cd", "cicd", "ci cd", "continuous integration", "continuous deployment"],
+    "Jenkins": ["jenkins ci"],
+    "GitHub Actions": ["gh actions"],
+    "Git": ["git scm"],
+    "Linux": ["gnu/linux"],
+    "Microservices": ["microservice architecture"],
+
+    # Data science and analytics
+    "Machine Learning (ML)": ["ml", "machine learning"],
+    "Artificial Intelligence (AI)": ["ai", "artificial intelligence"],
+    "Deep Learning": ["dl"],
+    "Natural Language Processing (NLP)": ["nlp", "natural language processing"],
+    "Computer Vision": ["machine vision"],
+    "Data Analysis": ["data analytics"],
+    "Data Visualization": ["dataviz", "data viz"],
+    "Extract, Transform, Load (ETL)": ["etl", "extract transform load"],
+    "Tableau": ["tableau desktop"],
+    "Power BI": ["powerbi", "microsoft power bi"],
+    "Microsoft Excel": ["excel", "ms excel"],
+    "Statistics": ["statistical analysis"],
+
+    # Marketing and business
+    "Search Engine Optimization (SEO)": ["seo", "search engine optimization"],
+    "Search Engine Marketing (SEM)": ["sem", "search engine marketing"],
+    "Social Media Marketing": ["smm"],
+    "Content Marketing": ["content marketing strategy"],
+    "Email Marketing": ["e-mail marketing"],
+    "Google Analytics": ["ga", "ga4"],
+    "Customer Relationship Management (CRM)": ["crm", "customer relationship management"],
+    "Salesforce": ["sfdc"],
+    "HubSpot": ["hubspot crm"],
+    "Key Performance Indicators (KPIs)": ["kpi", "kpis", "key performance indicators"],
+    "Return on Investment (ROI) Analysis": ["roi", "return on investment"],
+    "Business Intelligence (BI)": ["bi", "business intelligence"],
+    "Enterprise Resource Planning (ERP)": ["erp", "enterprise resource planning"],
+    "Google Ads": ["adwords", "google adwords"],
+
+    # Project management and practices
+    "Agile": ["agile methodology", "agile development"],
+    "Scrum": ["scrum methodology"],
+    "Kanban": ["kanban method"],
+    "Project Management": ["project mgmt"],
+    "Project Management Professional (PMP)": ["pmp"],
+    "Jira": ["atlassian jira"],
+    "Test-Driven Development (TDD)": ["tdd", "test driven development"],
+    "Unit Testing": ["unit tests"],
+    "Object-Oriented Programming (OOP)": ["oop", "object oriented programming"],
+    "User Experience (UX) Design": ["ux", "user experience", "ux design"],
+    "User Interface (UI) Design": ["ui", "user interface", "ui design"],
+    "Figma": ["figma design"],
+    "Quality Assurance (QA)": ["qa", "quality assurance"],
+
+    # Soft skills
+    "Leadership": ["leadership skills"],
+    "Communication": ["communication skills"],
+    "Problem Solving": ["problem-solving"],
+    "Stakeholder Management": ["stakeholder engagement"],
+    "Cross-functional Collaboration": ["cross functional collaboration"],
+    "Time Management": ["time-management"],
+    "Public Speaking": ["public speaker"],
+    "Negotiation": ["negotiating"],
+    "Customer Service": ["customer care"],
+}
+
+# Related terms that should surface a canonical skill while typing but are
+# distinct skills in their own right, so normalization leaves them as written
+SKILL_RELATED = {
+    "Bash": ["shell scripting", "shell"],
+    "Django": ["django rest framework", "drf"],
+    "Spring Boot": ["spring"],
+    ".NET": ["asp.net"],
+    "Redux": ["redux toolkit"],
+    "Elasticsearch": ["elk"],
+    "Apache Spark": ["pyspark"],
+    "Docker": ["containers", "containerization"],
+    "Kubernetes": ["container orchestration"],
+    "Terraform": ["iac", "infrastructure as code"],
+    "Git": ["github", "gitlab", "version control"],
+    "Linux": ["unix", "ubuntu"],
+    "Deep Learning": ["neural networks"],
+    "Computer Vision": ["image processing"],
+    "Data Analysis": ["analytics"],
+    "Extract, Transform, Load (ETL)": ["data pipelines"],
+    "Microsoft Excel": ["spreadsheets"],
+    "Search Engine Marketing (SEM)": ["ppc", "pay per click"],
+    "Social Media Marketing": ["social media"],
+    "Content Marketing": ["content creation", "content strategy"],
+    "Email Marketing": ["email campaigns"],
+    "Enterprise Resource Planning (ERP)": ["sap"],
+    "Scrum": ["scrum master", "sprint planning"],
+    "Kanban": ["kanban boards"],
+    "Project Management": ["program management"],
+    "Unit Testing": ["pytest", "jest", "junit"],
+    "Leadership": ["team leadership", "people management"],
+    "Communication": ["verbal communication", "written communication"],
+    "Problem Solving": ["troubleshooting"],
+    "Cross-functional Collaboration": ["collaboration", "teamwork"],
+    "Time Management": ["prioritization"],
+    "Public Speaking": ["presentations", "presentation skills"],
+    "Customer Service": ["customer support", "client relations"],
+}
+
+
+def normalize_skill_key(text):
+    """Lowercase a skill and strip punctuation that does not carry meaning."""
+    text = re.sub(r'[^\w+#./\s-]', ' ', text.lower())
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+class SkillIndex:
+    """Sorted-array prefix index over canonical skills and their aliases.
+
+    Every alias is indexed whole and from each word boundary, so "engine"
+    still finds "Search Engine Optimization (SEO)". Related terms are indexed
+    for suggestions only and never used by normalize(). Lookups are two
+    binary searches plus a scan of the matching slice.
+    """
+
+    def __init__(self, catalog, related=None):
+        self._canonical = {}  # normalized name or alias -> canonical name
+        entries = []          # (key, is_word_suffix, is_alias, canonical)
+
+        for canonical, aliases in catalog.items():
+            for is_alias, term in enumerate((canonical, *aliases)):
+                key = normalize_skill_key(term)
+                self._canonical.setdefault(key, canonical)
+                self._index_term(entries, key, is_alias > 0, canonical)
+
+        for canonical, terms in (related or {}).items():
+            for term in terms:
+                self._index_term(entries, normalize_skill_key(term), True, canonical)
+
+        entries.sort()
+        self._keys = [entry[0] for entry in entries]
+        self._entries = entries
+
+    @staticmethod
+    def _index_term(entries, key, is_alias, canonical):
+        words = key.split(' ')
+        for i in range(len(words)):
+            entries.append((' '.join(words[i:]), i > 0, is_alias, canonical))
+
+    def __len__(self):
+        return len(self._canonical)
+
+    def suggest(self, query, limit=8):
+        """Return up to `limit` canonical skills matching the typed prefix."""
+        key = normalize_skill_key(query)
+        if not key:
+            return []
+
+        lo = bisect_left(self._keys, key)
+        hi = bisect_left(self._keys, key + '\uffff', lo)
+
+        # Rank exact hits first, then whole-name prefixes, canonical names
+        # before aliases, then shorter keys
+        best = {}
+        for indexed, is_suffix, is_alias, canonical in self._entries[lo:hi]:
+            rank = (indexed != key, is_suffix, is_alias, len(indexed))
+            if canonical not in best or rank < best[canonical]:
+                best[canonical] = rank
+
+        return sorted(best, key=lambda name: (best[name], name))[:limit]
+
+    def normalize(self, skills):
+        """Map free-form skills to canonical names, preserving order and dropping duplicates."""
+        seen = set()
+        normalized = []
+        for raw in skills:
+            raw = raw.strip()
+            if not raw:
+                continue
+            name = self._canonical.get(normalize_skill_key(raw), raw)
+            if name.lower() not in seen:
+                seen.add(name.lower())
+                normalized.append(name)
+        return normalized
+
+
+skill_index = SkillIndex(SKILL_CATALOG, SKILL_RELATED)
+
+
 def sanitize_input(text, max_chars=3000):
     """Clean and limit input text."""
     if not text:
@@ -276,27 +1563,28 @@ def clean_ai_response(text):
     return text.strip()
 
 
-def enhance_section(section_name, content, max_retries=2):
-    """Enhance a resume section using Groq AI with your specific prompts."""
-    if not client:
+def enhance_section(section_name, content, max_retries=2, deadline=None):
+    """Enhance a resume section using Groq AI with your specific prompts.
+
+    Raises LLMUnavailableError when the AI service cannot answer within the
+    request deadline or the circuit breaker is open.
+    """
+    if not get_groq_client():
         logger.error("Groq client not available")
         return content
 
     section_name = section_name.lower().strip()
+    deadline = deadline or request_deadline()
 
-    # Handle projects - parse JSON if provided
+    # Projects given as a JSON list are enhanced one by one; the result is a
+    # JSON list of {"title", "description"} objects
     if section_name == "projects":
         try:
             projects = json.loads(content)
-            if isinstance(projects, list) and projects:
-                formatted = "\n\n".join([
-                    f"Project {i + 1}:\nTitle: {p.get('title', 'Untitled')}\n"
-                    f"Description: {p.get('description', 'No description')}"
-                    for i, p in enumerate(projects)
-                ])
-                content = formatted
         except (json.JSONDecodeError, TypeError):
-            pass
+            projects = None
+        if isinstance(projects, list) and projects:
+            return json.dumps(enhance_items("projects", projects, deadline))
 
     # Sanitize input
     content = sanitize_input(content)
@@ -315,14 +1603,13 @@ def enhance_section(section_name, content, max_retries=2):
         f"Enhanced Content:"
     )
 
-    # Retry logic with exponential backoff
+    # Retry logic with exponential backoff, bounded by the request deadline
     for attempt in range(max_retries + 1):
         try:
             logger.info(f"Enhancing {section_name} (attempt {attempt + 1}/{max_retries + 1})")
 
-            response = client.chat.completions.create(
-                model=GROQ_MODEL,
-                messages=[
+            response = call_llm(
+                [
                     {
                         "role": "system",
                         "content": "You are an expert resume consultant. Follow the instructions precisely and return ONLY the enhanced content without any preambles, explanations, or meta-commentary."
@@ -332,13 +1619,15 @@ def enhance_section(section_name, content, max_retries=2):
                         "content": full_prompt
                     }
                 ],
+                deadline=deadline,
                 temperature=0.5,
                 max_tokens=1024,
                 top_p=0.95
             )
 
-            enhanced = response.choices[0].message.content.strip()
-            enhanced = clean_ai_response(enhanced)
+            with allocation_trace('groq_response'):
+                enhanced = response.choices[0].message.content.strip()
+                enhanced = clean_ai_response(enhanced)
 
             if not enhanced:
                 raise ValueError("Empty response from AI")
@@ -346,16 +1635,1072 @@ def enhance_section(section_name, content, max_retries=2):
             logger.info(f"Successfully enhanced {section_name} ({len(enhanced)} chars)")
             return enhanced
 
+        except (CircuitOpenError, DeadlineExceeded):
+            raise
         except Exception as e:
             logger.error(f"Enhancement failed (attempt {attempt + 1}): {str(e)}")
+            backoff = 1 * (2 ** attempt)
             if attempt >= max_retries:
-                logger.warning(f"Max retries reached, returning original content for {section_name}")
-                return content
-            time.sleep(1 * (2 ** attempt))
+                raise LLMUnavailableError(f"AI enhancement failed after {attempt + 1} attempts") from e
+            if deadline - time.monotonic() < backoff + LLM_MIN_CALL_SECONDS:
+                raise DeadlineExceeded("Request deadline leaves no time for another attempt") from e
+            time.sleep(backoff)
 
     return content
 
 
+# -----------------------------------------------------------------------------
+# Resume model
+# One typed, slotted representation of a resume shared by every endpoint and
+# both renderers. Request bodies are size-checked and parsed once, before a
+# scheduler slot is taken, then decoded field by field against precomputed
+# plans with per-field length and per-list count limits.
+# -----------------------------------------------------------------------------
+RESUME_MAX_BYTES = 256 * 1024        # JSON body of a whole resume or item batch
+ENHANCE_MAX_BYTES = 64 * 1024        # JSON body of a single section enhancement
+RESUME_MAX_ENTRIES = 30              # Experiences, schools or projects per resume
+RESUME_MAX_SKILLS = 150
+SHORT_FIELD_CHARS = 300              # Names, titles, dates, contact details
+LONG_FIELD_CHARS = 8000              # Summaries and descriptions
+SECTION_FIELD_CHARS = 40000          # A whole free-text section in the legacy shape
+IMPORTED_RESUME_BYTES = RESUME_MAX_BYTES * 3 // 4  # Leaves room for edits after an import
+ENHANCE_MAX_CONTENT_CHARS = 20000
+
+# Section keys of the older free-text payload ({"Name": ..., "Work Experience": ...})
+LEGACY_SECTIONS = ('Name', 'Contact Information', 'Professional Summary',
+                   'Work Experience', 'Education', 'Skills', 'Projects')
+SKILL_SPLIT_RE = re.compile(r'\s*[,\n;]\s*')
+CONTACT_SPLIT_RE = re.compile(r'\s*[|•·\n]\s*')
+MONTH_NAMES = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
+class PayloadError(ValueError):
+    """Raised when a request body is missing, malformed or fails validation."""
+
+    status_code = 400
+
+
+class PayloadTooLargeError(PayloadError):
+    status_code = 413
+
+
+def _text(*keys, max_chars=SHORT_FIELD_CHARS):
+    """Declare a string field read from the first present JSON key in keys."""
+    return dataclass_field(default='', metadata={'keys': keys, 'kind': str, 'max_chars': max_chars})
+
+
+def _flag(*keys):
+    return dataclass_field(default=False, metadata={'keys': keys, 'kind': bool})
+
+
+@dataclass(slots=True)
+class PersonalInfo:
+    full_name: str = _text('fullName', 'name')
+    email: str = _text('email')
+    phone: str = _text('phone')
+    location: str = _text('location')
+    linkedin: str = _text('linkedin')
+    summary: str = _text('summary', max_chars=LONG_FIELD_CHARS)
+
+    def contact_line(self):
+        return ' | '.join(part for part in (self.email, self.phone, self.location, self.linkedin) if part)
+
+
+@dataclass(slots=True)
+class Experience:
+    title: str = _text('title')
+    company: str = _text('company')
+    start_date: str = _text('startDate')
+    end_date: str = _text('endDate')
+    current: bool = _flag('current')
+    description: str = _text('description', max_chars=LONG_FIELD_CHARS)
+
+    body_field = 'description'
+
+    def heading(self):
+        end = 'Present' if self.current else format_month(self.end_date)
+        dates = ' – '.join(part for part in (format_month(self.start_date), end) if part)
+        heading = ' — '.join(part for part in (self.title, self.company) if part)
+        return f"{heading} ({dates})" if heading and dates else heading or dates
+
+
+@dataclass(slots=True)
+class Education:
+    degree: str = _text('degree')
+    field_of_study: str = _text('field')
+    institution: str = _text('institution', 'school')
+    year: str = _text('year')
+    details: str = _text('details', max_chars=LONG_FIELD_CHARS)
+
+    body_field = 'details'
+
+    def heading(self):
+        degree = ' in '.join(part for part in (self.degree, self.field_of_study) if part)
+        heading = ' — '.join(part for part in (degree, self.institution) if part)
+        return f"{heading} ({self.year})" if heading and self.year else heading or self.year
+
+
+@dataclass(slots=True)
+class Project:
+    title: str = _text('title')
+    description: str = _text('description', max_chars=LONG_FIELD_CHARS)
+
+    body_field = 'description'
+
+    def heading(self):
+        return self.title
+
+
+@dataclass(slots=True)
+class EnhanceRequest:
+    section: str = _text('section', max_chars=50)
+    content: str = _text('content', max_chars=ENHANCE_MAX_CONTENT_CHARS)
+
+
+@dataclass(slots=True)
+class Resume:
+    personal: PersonalInfo = dataclass_field(default_factory=PersonalInfo)
+    experiences: list = dataclass_field(default_factory=list)
+    education: list = dataclass_field(default_factory=list)
+    skills: list = dataclass_field(default_factory=list)
+    projects: list = dataclass_field(default_factory=list)
+
+    def is_empty(self):
+        return not (any(getattr(self.personal, name) for name in self.personal.__slots__)
+                    or self.experiences or self.education or self.skills or self.projects)
+
+    def sections(self):
+        """Yield (heading, text) for each non-empty section in render order.
+
+        Entries are separated by blank lines, with each entry's heading line
+        in its own block ahead of its description.
+        """
+        if self.personal.summary:
+            yield 'Professional Summary', self.personal.summary
+        for heading, entries in (('Work Experience', self.experiences),
+                                 ('Education', self.education)):
+            text = _entries_text(entries)
+            if text:
+                yield heading, text
+        if self.skills:
+            yield 'Skills', ', '.join(self.skills)
+        text = _entries_text(self.projects)
+        if text:
+            yield 'Projects', text
+
+    def analysis_text(self):
+        """Plain-text digest of the resume for the analysis prompt."""
+        personal = self.personal
+        experiences = '\n'.join(
+            f"- {exp.title} at {exp.company} ({exp.start_date} - {'Present' if exp.current else exp.end_date})"
+            for exp in self.experiences)
+        education = '\n'.join(
+            f"- {edu.degree} in {edu.field_of_study} from {edu.institution}" for edu in self.education)
+        return f"""
+Personal Information:
+- Name: {personal.full_name or 'Not provided'}
+- Email: {personal.email or 'Not provided'}
+- Phone: {personal.phone or 'Not provided'}
+- LinkedIn: {personal.linkedin or 'Not provided'}
+- Summary: {personal.summary or 'Not provided'}
+
+Work Experience ({len(self.experiences)} entries):
+{experiences}
+
+Education ({len(self.education)} entries):
+{education}
+
+Skills ({len(self.skills)} skills):
+{', '.join(self.skills)}
+"""
+
+    def to_dict(self):
+        """Encode in the frontend's resumeData shape."""
+        return {
+            "personal": _encode_struct(self.personal),
+            "experiences": [_encode_struct(item) for item in self.experiences],
+            "education": [_encode_struct(item) for item in self.education],
+            "skills": ', '.join(self.skills),
+            "projectsList": [_encode_struct(item) for item in self.projects],
+        }
+
+
+def _field_plan(cls):
+    return tuple((f.name, f.metadata['keys'], f.metadata['kind'], f.metadata.get('max_chars'))
+                 for f in dataclass_fields(cls))
+
+
+FIELD_PLANS = {cls: _field_plan(cls) for cls in (PersonalInfo, Experience, Education, Project, EnhanceRequest)}
+
+# Resume attribute -> (accepted JSON keys, item type)
+RESUME_LISTS = (
+    ('experiences', ('experiences', 'experience'), Experience),
+    ('education', ('education',), Education),
+    ('projects', ('projectsList', 'projects'), Project),
+)
+
+
+def format_month(value):
+    """Render an <input type="month"> value ("2020-01") as "Jan 2020"."""
+    match = re.fullmatch(r'(\d{4})-(\d{2})', value)
+    if not match or not 1 <= int(match.group(2)) <= 12:
+        return value
+    return f"{MONTH_NAMES[int(match.group(2)) - 1]} {match.group(1)}"
+
+
+def _entries_text(entries):
+    blocks = []
+    for entry in entries:
+        heading = entry.heading()
+        body = getattr(entry, entry.body_field)
+        block = '\n\n'.join(part for part in (heading, body) if part)
+        if block:
+            blocks.append(block)
+    return '\n\n'.join(blocks)
+
+
+def _coerce_text(value, path, max_chars):
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        value = value.strip()
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        value = str(value)
+    else:
+        raise PayloadError(f"{path} must be a string")
+    if len(value) > max_chars:
+        raise PayloadError(f"{path} exceeds {max_chars} characters")
+    return value
+
+
+def decode_struct(cls, data, path=''):
+    """Decode a JSON object into one of the model dataclasses, ignoring unknown keys."""
+    if not isinstance(data, dict):
+        raise PayloadError(f"{path.rstrip('.') or 'Request body'} must be an object")
+    values = {}
+    for name, keys, kind, max_chars in FIELD_PLANS[cls]:
+        for key in keys:
+            if key in data:
+                break
+        else:
+            continue
+        value = data[key]
+        if kind is bool:
+            if value is not None and not isinstance(value, bool):
+                raise PayloadError(f"{path}{key} must be true or false")
+            values[name] = bool(value)
+        else:
+            values[name] = _coerce_text(value, f"{path}{key}", max_chars)
+    return cls(**values)
+
+
+def _encode_struct(obj):
+    return {keys[0]: getattr(obj, name) for name, keys, _, _ in FIELD_PLANS[type(obj)]}
+
+
+def _decode_skills(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        skills = SKILL_SPLIT_RE.split(_coerce_text(value, 'skills', LONG_FIELD_CHARS))
+    elif isinstance(value, list):
+        if len(value) > RESUME_MAX_SKILLS:
+            raise PayloadError(f"At most {RESUME_MAX_SKILLS} skills are allowed")
+        skills = [_coerce_text(skill, f"skills[{i}]", SHORT_FIELD_CHARS) for i, skill in enumerate(value)]
+    else:
+        raise PayloadError("skills must be a string or a list of strings")
+    skills = [skill for skill in skills if skill]
+    if len(skills) > RESUME_MAX_SKILLS:
+        raise PayloadError(f"At most {RESUME_MAX_SKILLS} skills are allowed")
+    return skills
+
+
+def _decode_legacy_resume(data):
+    """Decode the older free-text shape, one string per section heading."""
+    text = {}
+    for key in LEGACY_SECTIONS:
+        max_chars = SHORT_FIELD_CHARS if key == 'Name' else SECTION_FIELD_CHARS
+        value = _coerce_text(data.get(key), key, max_chars)
+        # Unfilled template placeholders such as "[Your skills]" are dropped
+        text[key] = '' if value.startswith('[') else value
+
+    email = phone = linkedin = ''
+    location = []
+    for part in CONTACT_SPLIT_RE.split(text['Contact Information']):
+        if not part:
+            continue
+        if not email and EMAIL_RE.fullmatch(part):
+            email = part
+        elif not phone and PHONE_RE.fullmatch(part):
+            phone = part
+        elif not linkedin and LINKEDIN_RE.fullmatch(part):
+            linkedin = part
+        else:
+            location.append(part)
+
+    personal = PersonalInfo(full_name=text['Name'], email=email, phone=phone,
+                            location=', '.join(location)[:SHORT_FIELD_CHARS],
+                            linkedin=linkedin, summary=text['Professional Summary'])
+    return Resume(
+        personal=personal,
+        experiences=[Experience(description=text['Work Experience'])] if text['Work Experience'] else [],
+        education=[Education(details=text['Education'])] if text['Education'] else [],
+        skills=_decode_skills(text['Skills']),
+        projects=[Project(description=text['Projects'])] if text['Projects'] else [],
+    )
+
+
+def decode_resume(data):
+    """Validate a resume payload and build a Resume.
+
+    Accepts the frontend's resumeData shape, the analysis shape (personalInfo,
+    experience, skills as a list) and the legacy free-text section shape.
+    Raises PayloadError describing the first offending field.
+    """
+    if not isinstance(data, dict):
+        raise PayloadError("Resume data must be an object")
+    if any(key in data for key in LEGACY_SECTIONS):
+        return _decode_legacy_resume(data)
+
+    personal = data.get('personal', data.get('personalInfo'))
+    resume = Resume(
+        personal=decode_struct(PersonalInfo, personal, 'personal.') if personal is not None else PersonalInfo(),
+        skills=_decode_skills(data.get('skills')),
+    )
+    for name, keys, cls in RESUME_LISTS:
+        items = next((data[key] for key in keys if key in data), None)
+        if items is None:
+            continue
+        if not isinstance(items, list):
+            raise PayloadError(f"{keys[0]} must be a list")
+        if len(items) > RESUME_MAX_ENTRIES:
+            raise PayloadError(f"At most {RESUME_MAX_ENTRIES} {keys[0]} entries are allowed")
+        setattr(resume, name, [decode_struct(cls, item, f"{keys[0]}[{i}].") for i, item in enumerate(items)])
+    return resume
+
+
+def fit_struct(cls, data):
+    """Build a model dataclass from extracted data, truncating over-long fields."""
+    values = {}
+    for name, keys, kind, max_chars in FIELD_PLANS[cls]:
+        value = data.get(keys[0])
+        values[name] = bool(value) if kind is bool else str(value or '').strip()[:max_chars].strip()
+    return cls(**values)
+
+
+def _encoded_size(value):
+    return len(json.dumps(value, ensure_ascii=False).encode())
+
+
+def fit_resume(data):
+    """Build a Resume from imported resumeData, cut down to the model's limits.
+
+    Importers keep whatever the source holds; unlike decode_resume this
+    truncates fields and drops surplus entries instead of rejecting them,
+    so an imported resume can always be sent back to /generate_resume.
+    Entries stop being added once the encoded resume would outgrow
+    IMPORTED_RESUME_BYTES.
+    """
+    skills, length = [], 0
+    for skill in SKILL_SPLIT_RE.split(data.get('skills') or ''):
+        skill = skill[:SHORT_FIELD_CHARS].strip()
+        if not skill:
+            continue
+        # Skills travel as one ", "-joined string, which has its own limit
+        length += len(skill) + (2 if skills else 0)
+        if len(skills) >= RESUME_MAX_SKILLS or length > LONG_FIELD_CHARS:
+            break
+        skills.append(skill)
+
+    resume = Resume(personal=fit_struct(PersonalInfo, data.get('personal') or {}), skills=skills)
+    size = _encoded_size(resume.to_dict())
+    for name, keys, cls in RESUME_LISTS:
+        entries = getattr(resume, name)
+        for item in data.get(keys[0], [])[:RESUME_MAX_ENTRIES]:
+            entry = fit_struct(cls, item)
+            size += _encoded_size(_encode_struct(entry)) + 1
+            if size > IMPORTED_RESUME_BYTES:
+                return resume
+            entries.append(entry)
+    return resume
+
+
+def read_json_payload(max_bytes):
+    """Read and parse the request body as JSON, reading at most max_bytes."""
+    if request.content_length is not None and request.content_length > max_bytes:
+        raise PayloadTooLargeError(f"Request body exceeds {max_bytes // 1024}KB limit")
+    # Bounded read so chunked bodies without a Content-Length are capped too
+    body = request.stream.read(max_bytes + 1)
+    if len(body) > max_bytes:
+        raise PayloadTooLargeError(f"Request body exceeds {max_bytes // 1024}KB limit")
+    if not body.strip():
+        raise PayloadError("No data provided")
+    try:
+        return json.loads(body)
+    except (ValueError, RecursionError):
+        raise PayloadError("Request body must be valid JSON")
+
+
+def json_payload(max_bytes):
+    """Parse the JSON body into g.payload before the handler is scheduled.
+
+    Oversized or malformed bodies are rejected here, so they never hold a
+    scheduler slot or reach the LLM.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                g.payload = read_json_payload(max_bytes)
+            except PayloadError as e:
+                logger.warning(f"Rejected {request.path} payload: {str(e)}")
+                return jsonify({"error": str(e)}), e.status_code
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# -----------------------------------------------------------------------------
+# Per-item enhancement for experiences and projects
+# Each item is its own LLM call, run concurrently on a bounded pool and cached
+# by a hash of its content, so editing one project re-enhances only that one.
+# -----------------------------------------------------------------------------
+LLM_FANOUT_WORKERS = int(os.getenv('LLM_FANOUT_WORKERS', '4'))
+ENHANCE_MAX_ITEMS = 20
+ITEM_CACHE_TTL = 7 * 24 * 60 * 60
+ITEM_PROMPT_VERSION = 1  # Bump when item prompts change to invalidate cached results
+
+ITEM_FIELDS = {
+    "experience": ("title", "company", "description"),
+    "projects": ("title", "description"),
+}
+ITEM_MODELS = {"experience": Experience, "projects": Project}
+
+llm_executor = ThreadPoolExecutor(max_workers=LLM_FANOUT_WORKERS, thread_name_prefix='llm-fanout')
+
+
+def cached_item(key):
+    """Look up an enhanced item in the shared cache; cache errors are treated as misses."""
+    try:
+        value = state.cache_get(f"item:{key}")
+        return json.loads(value) if value else None
+    except (StateBackendError, ValueError) as e:
+        logger.warning(f"Item cache read failed: {e}")
+        return None
+
+
+def store_cached_item(key, enhanced):
+    try:
+        state.cache_set(f"item:{key}", json.dumps(enhanced), ITEM_CACHE_TTL)
+    except StateBackendError as e:
+        logger.warning(f"Item cache write failed: {e}")
+
+
+def item_cache_key(section, item):
+    """Content hash of the fields that influence an item's enhancement."""
+    fields = {field: sanitize_input(str(item.get(field) or '')) for field in ITEM_FIELDS[section]}
+    payload = json.dumps([ITEM_PROMPT_VERSION, GROQ_MODEL, section, fields], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _parse_project_response(text, item):
+    """Read {"title", "description"} from the model, tolerating plain-text replies."""
+    match = re.search(r'\{[\s\S]*\}', text)
+    if match:
+        try:
+            parsed = json.loads(match.group())
+            if isinstance(parsed, dict) and parsed.get('description'):
+                return {"title": str(parsed.get('title') or item.get('title', '')).strip(),
+                        "description": str(parsed['description']).strip()}
+        except json.JSONDecodeError:
+            pass
+
+    title = re.search(r'^\s*Title:\s*(.+)$', text, re.MULTILINE | re.IGNORECASE)
+    description = re.search(r'Description:\s*([\s\S]+)', text, re.IGNORECASE)
+    return {
+        "title": title.group(1).strip() if title else item.get('title', ''),
+        "description": clean_ai_response(description.group(1) if description else text)
+    }
+
+
+def enhance_item(section, item, deadline):
+    """Enhance one experience or project and return its enhanced fields."""
+    if section == "experience":
+        role = " at ".join(p for p in (item.get('title'), item.get('company')) if p)
+        description = str(item.get('description') or '')
+        content = f"Role: {role}\n{description}" if role else description
+        return {"description": enhance_section("experience", content, deadline=deadline)}
+
+    content = (f"Title: {sanitize_input(str(item.get('title') or ''), 200)}\n"
+               f"Description: {sanitize_input(str(item.get('description') or ''))}")
+    prompt = f"{GLOBAL_RULE}\n\n{resume_prompts['project_item']}\n\nProject:\n{content}"
+    response = call_llm(
+        [
+            {"role": "system", "content": "You are an expert resume consultant. Respond with valid JSON only."},
+            {"role": "user", "content": prompt}
+        ],
+        deadline=deadline,
+        temperature=0.5,
+        max_tokens=400,
+        top_p=0.95
+    )
+    with allocation_trace('groq_response'):
+        return _parse_project_response(response.choices[0].message.content.strip(), item)
+
+
+def enhance_items(section, items, deadline=None):
+    """Enhance a list of experiences or projects concurrently.
+
+    Items are validated through the resume model first (PayloadError on bad
+    types or oversized fields). Returns one dict per item with its fields
+    overlaid by the enhanced ones, plus "cached" and, for items that failed,
+    "error". Raises LLMUnavailableError only when every uncached item failed
+    for that reason.
+    """
+    if section not in ITEM_FIELDS:
+        raise ValueError(f"Unsupported section for item enhancement: {section}")
+    if len(items) > ENHANCE_MAX_ITEMS:
+        raise ValueError(f"At most {ENHANCE_MAX_ITEMS} items can be enhanced at once")
+
+    # Decode everything up front so a bad item never leaves calls running
+    items = [_encode_struct(decode_struct(ITEM_MODELS[section], item, f"items[{i}]."))
+             for i, item in enumerate(items)]
+
+    deadline = deadline or request_deadline()
+    results = [None] * len(items)
+    pending = {}
+
+    for index, item in enumerate(items):
+        key = item_cache_key(section, item)
+        cached = cached_item(key)
+        if cached is not None:
+            results[index] = {**item, **cached, "cached": True}
+        elif not any(str(item.get(field) or '').strip() for field in ITEM_FIELDS[section]):
+            results[index] = {**item, "cached": False}
+        else:
+            pending[index] = (key, llm_executor.submit(enhance_item, section, item, deadline))
+
+    unavailable = []
+    for index, (key, future) in pending.items():
+        item = items[index]
+        try:
+            enhanced = future.result()
+            store_cached_item(key, enhanced)
+            # Enhanced items sent back unchanged are hits as well
+            store_cached_item(item_cache_key(section, {**item, **enhanced}), enhanced)
+            results[index] = {**item, **enhanced, "cached": False}
+        except LLMUnavailableError as e:
+            unavailable.append(e)
+            results[index] = {**item, "cached": False, "error": str(e)}
+        except Exception as e:
+            logger.error(f"Item enhancement failed for {section}[{index}]: {str(e)}")
+            results[index] = {**item, "cached": False, "error": "Enhancement failed"}
+
+    if pending and len(unavailable) == len(pending):
+        raise unavailable[0]
+
+    logger.info(f"Enhanced {len(pending)} of {len(items)} {section} items "
+                f"({len(items) - len(pending)} cached or empty)")
+    return results
+
+
+# -----------------------------------------------------------------------------
+# LinkedIn data export import
+# Parses LinkedIn's "Get a copy of your data" ZIP (or a saved profile page)
+# into the frontend's resumeData shape, cut down to the resume model's limits
+# by fit_resume(). ZIP members are decoded as streams straight from the
+# upload, so nothing is extracted to disk and only one CSV row is held at a
+# time.
+# -----------------------------------------------------------------------------
+IMPORT_MAX_BYTES = 25 * 1024 * 1024         # Whole upload
+IMPORT_MAX_MEMBER_BYTES = 10 * 1024 * 1024  # Uncompressed size of a single CSV
+IMPORT_MAX_HTML_BYTES = 5 * 1024 * 1024
+IMPORT_TIME_LIMIT = 10.0                    # Seconds of parsing per upload
+
+MONTHS = {m: i + 1 for i, m in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'])}
+
+
+class ImportLimitError(ValueError):
+    """Raised when an upload exceeds the configured size or time limits."""
+
+
+def empty_resume_data():
+    """Return an empty resume in the frontend's resumeData shape."""
+    return Resume().to_dict()
+
+
+def _check_deadline(deadline):
+    if time.monotonic() > deadline:
+        raise ImportLimitError(f"Import took longer than {IMPORT_TIME_LIMIT:.0f}s")
+
+
+def to_month_value(text):
+    """Convert LinkedIn dates ("Jan 2020", "2020") to <input type="month"> values."""
+    if not text:
+        return ""
+    match = re.search(r'(?:([A-Za-z]{3})[a-z]*\.?\s+)?(\d{4})', text)
+    if not match:
+        return ""
+    month = MONTHS.get((match.group(1) or 'jan').lower(), 1)
+    return f"{match.group(2)}-{month:02d}"
+
+
+def _iter_csv_rows(zf, basename, deadline):
+    """Stream rows of a CSV member, matched by file name anywhere in the archive."""
+    member = next((info for info in zf.infolist()
+                   if os.path.basename(info.filename).lower() == basename.lower()), None)
+    if member is None:
+        return
+    if member.file_size > IMPORT_MAX_MEMBER_BYTES:
+        raise ImportLimitError(f"{basename} is larger than {IMPORT_MAX_MEMBER_BYTES // (1024 * 1024)}MB")
+
+    with zf.open(member) as raw:
+        text = io.TextIOWrapper(raw, encoding='utf-8-sig', errors='replace', newline='')
+        lines = iter(text)
+
+        # Some exports start with a "Notes:" preamble, ended by a blank line
+        header = next(lines, '')
+        if header.lower().startswith('notes'):
+            for header in lines:
+                if not header.strip():
+                    break
+            header = next(lines, '')
+        if not header.strip():
+            return
+
+        try:
+            reader = csv.DictReader(lines, fieldnames=next(csv.reader([header])))
+            for i, row in enumerate(reader):
+                if i % 200 == 0:
+                    _check_deadline(deadline)
+                yield {k.strip(): (v or '').strip() for k, v in row.items() if k}
+        except csv.Error as e:
+            if 'field larger than field limit' in str(e):
+                raise ImportLimitError(f"{basename} has a field larger than {csv.field_size_limit() // 1024}KB")
+            raise ValueError(f"{basename} is not a valid CSV file: {str(e)}")
+
+
+def parse_linkedin_export(stream, deadline):
+    """Map a LinkedIn data export ZIP onto the resumeData shape."""
+    resume = empty_resume_data()
+    personal = resume["personal"]
+
+    with zipfile.ZipFile(stream) as zf:
+        for row in _iter_csv_rows(zf, 'Profile.csv', deadline):
+            personal["fullName"] = f"{row.get('First Name', '')} {row.get('Last Name', '')}".strip()
+            personal["location"] = row.get('Geo Location') or row.get('Address', '')
+            personal["summary"] = row.get('Summary') or row.get('Headline', '')
+            break
+
+        for row in _iter_csv_rows(zf, 'Email Addresses.csv', deadline):
+            if not personal["email"] or row.get('Primary', '').lower() == 'yes':
+                personal["email"] = row.get('Email Address', '')
+
+        for row in _iter_csv_rows(zf, 'PhoneNumbers.csv', deadline):
+            personal["phone"] = row.get('Number', '')
+            break
+
+        for row in _iter_csv_rows(zf, 'Positions.csv', deadline):
+            if len(resume["experiences"]) >= RESUME_MAX_ENTRIES:
+                break
+            resume["experiences"].append({
+                "title": row.get('Title', ''),
+                "company": row.get('Company Name', ''),
+                "startDate": to_month_value(row.get('Started On')),
+                "endDate": to_month_value(row.get('Finished On')),
+                "current": not row.get('Finished On'),
+                "description": row.get('Description', '')
+            })
+
+        for row in _iter_csv_rows(zf, 'Education.csv', deadline):
+            if len(resume["education"]) >= RESUME_MAX_ENTRIES:
+                break
+            year = re.search(r'\d{4}', row.get('End Date', '') or row.get('Start Date', ''))
+            resume["education"].append({
+                "degree": row.get('Degree Name', ''),
+                "field": "",
+                "institution": row.get('School Name', ''),
+                "year": year.group() if year else "",
+                "details": row.get('Notes') or row.get('Activities', '')
+            })
+
+        skills = []
+        for row in _iter_csv_rows(zf, 'Skills.csv', deadline):
+            if len(skills) >= RESUME_MAX_SKILLS:
+                break
+            if row.get('Name'):
+                skills.append(row['Name'])
+        resume["skills"] = ", ".join(skills)
+
+        for row in _iter_csv_rows(zf, 'Projects.csv', deadline):
+            if len(resume["projectsList"]) >= RESUME_MAX_ENTRIES:
+                break
+            resume["projectsList"].append({
+                "title": row.get('Title', ''),
+                "description": row.get('Description', '')
+            })
+
+    return fit_resume(resume).to_dict()
+
+
+def _section_items(soup, anchor_id, deadline, limit=RESUME_MAX_ENTRIES):
+    """Yield the visible text fragments of up to `limit` list items in a profile section."""
+    anchor = soup.find(id=anchor_id)
+    section = anchor.find_parent('section') if anchor else None
+    if not section:
+        return
+    for item in section.find_all('li', recursive=True):
+        if limit <= 0:
+            return
+        _check_deadline(deadline)
+        # LinkedIn duplicates text for screen readers; aria-hidden spans hold the visible copy
+        texts = [span.get_text(' ', strip=True) for span in item.find_all('span', attrs={'aria-hidden': 'true'})]
+        texts = [t for i, t in enumerate(texts) if t and t not in texts[:i]]
+        if texts:
+            limit -= 1
+            yield texts
+
+
+def parse_linkedin_html(stream, deadline):
+    """Best-effort extraction from a saved LinkedIn profile page."""
+    html = stream.read(IMPORT_MAX_HTML_BYTES + 1)
+    if len(html) > IMPORT_MAX_HTML_BYTES:
+        raise ImportLimitError(f"Profile page is larger than {IMPORT_MAX_HTML_BYTES // (1024 * 1024)}MB")
+
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    resume = empty_resume_data()
+    personal = resume["personal"]
+
+    heading = soup.find('h1')
+    og_title = soup.find('meta', attrs={'property': 'og:title'})
+    if heading:
+        personal["fullName"] = heading.get_text(' ', strip=True)
+    elif og_title:
+        personal["fullName"] = og_title.get('content', '').split('|')[0].split(' - ')[0].strip()
+
+    canonical = soup.find('link', rel='canonical')
+    if canonical and 'linkedin.com/in/' in canonical.get('href', ''):
+        personal["linkedin"] = canonical['href']
+
+    about = next(_section_items(soup, 'about', deadline), None)
+    description = soup.find('meta', attrs={'name': 'description'})
+    if about:
+        personal["summary"] = ' '.join(about)
+    elif description:
+        personal["summary"] = description.get('content', '')
+
+    for texts in _section_items(soup, 'experience', deadline):
+        dates = next((t for t in texts[1:] if re.search(r'\d{4}', t)), '')
+        start, _, end = dates.split('·')[0].partition(' - ')
+        resume["experiences"].append({
+            "title": texts[0],
+            "company": texts[1].split('·')[0].strip() if len(texts) > 1 else '',
+            "startDate": to_month_value(start),
+            "endDate": to_month_value(end),
+            "current": 'present' in end.lower(),
+            "description": '\n'.join(t for t in texts[2:] if t != dates and len(t) > 40)
+        })
+
+    for texts in _section_items(soup, 'education', deadline):
+        degree, _, field = (texts[1] if len(texts) > 1 else '').partition(',')
+        years = re.findall(r'\d{4}', ' '.join(texts[2:]))
+        resume["education"].append({
+            "degree": degree.strip(),
+            "field": field.strip(),
+            "institution": texts[0],
+            "year": years[-1] if years else "",
+            "details": ""
+        })
+
+    resume["skills"] = ", ".join(texts[0] for texts in _section_items(soup, 'skills', deadline, RESUME_MAX_SKILLS))
+    return fit_resume(resume).to_dict()
+
+
+# -----------------------------------------------------------------------------
+# Existing resume ingestion
+# Extracts text from uploaded DOCX/PDF resumes and splits it into the sections
+# create_enhanced_docx() uses, with local heuristics only. Results are cached
+# by content hash so re-uploading the same file is instant.
+# -----------------------------------------------------------------------------
+RESUME_UPLOAD_MAX_BYTES = 10 * 1024 * 1024
+RESUME_PARSE_TIME_LIMIT = 15.0  # Seconds of text extraction per upload
+RESUME_PDF_MAX_PAGES = 30
+PDF_PARALLEL_MIN_PAGES = 3      # Shorter PDFs are cheaper to extract in-process
+PDF_WORKERS = min(4, os.cpu_count() or 1)
+PARSED_RESUME_CACHE_SIZE = 128
+
+RESUME_SECTION_HEADINGS = {
+    'Contact Information': ['contact', 'contact information', 'contact details', 'personal information', 'personal details'],
+    'Professional Summary': ['summary', 'professional summary', 'profile', 'professional profile', 'about', 'about me',
+                             'objective', 'career objective', 'career summary', 'executive summary'],
+    'Work Experience': ['experience', 'work experience', 'professional experience', 'employment',
+                        'employment history', 'work history', 'career history', 'relevant experience'],
+    'Education': ['education', 'academic background', 'education and training', 'academic qualifications',
+                  'qualifications', 'education & certifications', 'education and certifications'],
+    'Skills': ['skills', 'technical skills', 'key skills', 'core competencies', 'competencies',
+               'skills & abilities', 'skills and abilities', 'areas of expertise', 'technologies'],
+    'Projects': ['projects', 'personal projects', 'key projects', 'academic projects', 'selected projects'],
+}
+HEADING_LOOKUP = {alias: section for section, aliases in RESUME_SECTION_HEADINGS.items() for alias in aliases}
+
+BULLET_RE = re.compile(r'^\s*[•▪◦●\-\*–]\s*')
+DATE_TOKEN = r'(?:[A-Za-z]{3,9}\.?\s+)?\d{4}'
+DATE_RANGE_RE = re.compile(
+    rf'({DATE_TOKEN})\s*(?:-|–|—|to)\s*({DATE_TOKEN}|present|current|now)', re.IGNORECASE)
+BRACKETED_DATE_RE = re.compile(rf'\(\s*(?:{DATE_TOKEN})?\s*\)')
+EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+PHONE_RE = re.compile(r'\+?\d[\d\s().-]{7,}\d')
+LINKEDIN_RE = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/in/[\w-]+/?', re.IGNORECASE)
+DEGREE_RE = re.compile(
+    r'\b(?:bachelor|master|doctor|ph\.?d|mba|b\.?s\.?c?|m\.?s\.?c?|b\.?a|m\.?a|b\.?tech|m\.?tech|b\.?e|m\.?e|'
+    r'associate|diploma|certificate|high school)\b', re.IGNORECASE)
+
+parsed_resume_cache = LRUCache(PARSED_RESUME_CACHE_SIZE)  # sha256 -> parsed result
+pdf_executor = None
+pdf_executor_lock = threading.Lock()
+
+
+def _load_pdf_reader():
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise RuntimeError("PDF support requires the 'pypdf' package")
+    return PdfReader
+
+
+def _pdf_page_texts(data, start, stop):
+    """Extract text from a range of PDF pages. Runs in worker processes."""
+    reader = _load_pdf_reader()(io.BytesIO(data))
+    return [reader.pages[i].extract_text() or '' for i in range(start, stop)]
+
+
+def _pdf_open(data):
+    """Count pages and, for short PDFs, extract them too. Runs in a worker process.
+
+    Returns (page_count, texts); texts is None when the PDF is long enough to
+    be fanned out across workers.
+    """
+    reader = _load_pdf_reader()(io.BytesIO(data))
+    page_count = len(reader.pages)
+    if page_count > RESUME_PDF_MAX_PAGES:
+        raise ValueError(f"PDF has {page_count} pages; the limit is {RESUME_PDF_MAX_PAGES}")
+    if page_count < PDF_PARALLEL_MIN_PAGES or PDF_WORKERS < 2:
+        return page_count, [page.extract_text() or '' for page in reader.pages]
+    return page_count, None
+
+
+def _get_pdf_executor():
+    """Create the PDF worker pool on first use.
+
+    Workers are spawned rather than forked: forking a multithreaded server
+    copies locks held by other threads into the child.
+    """
+    global pdf_executor
+    with pdf_executor_lock:
+        if pdf_executor is None:
+            pdf_executor = ProcessPoolExecutor(max_workers=PDF_WORKERS,
+                                               mp_context=multiprocessing.get_context('spawn'))
+        return pdf_executor
+
+
+def _discard_pdf_executor(executor, terminate=False):
+    """Drop a broken or stuck pool so the next PDF starts a fresh one."""
+    global pdf_executor
+    with pdf_executor_lock:
+        if pdf_executor is executor:
+            pdf_executor = None
+    if terminate:
+        # shutdown() never interrupts a running task, so stop stuck workers directly
+        for process in list((getattr(executor, '_processes', None) or {}).values()):
+            process.terminate()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def extract_pdf_text(data, deadline):
+    """Extract text from a PDF in worker processes, within `deadline` (time.monotonic()).
+
+    Parsing always happens out of process, so a pathological PDF can be
+    stopped when the deadline passes instead of holding the request slot.
+    """
+    executor = _get_pdf_executor()
+
+    def result(future):
+        return future.result(timeout=max(deadline - time.monotonic(), 0))
+
+    try:
+        page_count, texts = result(executor.submit(_pdf_open, data))
+        if texts is None:
+            chunk = -(-page_count // PDF_WORKERS)
+            futures = [executor.submit(_pdf_page_texts, data, start, min(start + chunk, page_count))
+                       for start in range(0, page_count, chunk)]
+            texts = [text for future in futures for text in result(future)]
+        return '\n'.join(texts)
+    except FutureTimeoutError:
+        _discard_pdf_executor(executor, terminate=True)
+        raise ImportLimitError(f"PDF text extraction took longer than {RESUME_PARSE_TIME_LIMIT:.0f}s")
+    except BrokenExecutor:
+        # A worker died (e.g. killed for memory on a hostile PDF)
+        _discard_pdf_executor(executor)
+        raise
+
+
+def extract_docx_text(data):
+    """Extract paragraph and table text from a DOCX, marking list items as bullets."""
+    from docx import Document
+
+    document = Document(io.BytesIO(data))
+    lines = []
+    for para in document.paragraphs:
+        text = para.text.strip()
+        if not text:
+            continue
+        if para.style is not None and para.style.name.lower().startswith('list') and not BULLET_RE.match(text):
+            text = f"• {text}"
+        lines.append(text)
+
+    for table in document.tables:
+        for row in table.rows:
+            for cell in row.cells:
+                lines.extend(ln.strip() for ln in cell.text.splitlines() if ln.strip())
+
+    return '\n'.join(lines)
+
+
+def _match_heading(line):
+    """Return the canonical section for a heading line, or None."""
+    if len(line) > 40:
+        return None
+    key = re.sub(r'[^a-z& ]', '', line.lower()).strip()
+    return HEADING_LOOKUP.get(key)
+
+
+def split_resume_sections(text):
+    """Split plain resume text into the sections used by create_enhanced_docx()."""
+    sections = {name: [] for name in RESUME_SECTION_HEADINGS}
+    header = []
+    current = None
+
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        heading = _match_heading(line)
+        if heading:
+            current = heading
+            continue
+        (sections[current] if current else header).append(line)
+
+    # Lines before the first heading hold the name and contact details
+    name = header[0] if header and not EMAIL_RE.search(header[0]) else ''
+    sections['Contact Information'] = (header[1:] if name else header) + sections['Contact Information']
+
+    result = {'Name': name}
+    result.update({section: '\n'.join(lines) for section, lines in sections.items()})
+    return result
+
+
+def _split_entries(text):
+    """Group section lines into entries: header lines followed by bullet/body lines."""
+    entries = []
+    for line in text.splitlines():
+        is_body = bool(BULLET_RE.match(line)) or len(line) > 120
+        if not entries or (not is_body and entries[-1]['body']):
+            entries.append({'header': [], 'body': []})
+        if is_body:
+            entries[-1]['body'].append(BULLET_RE.sub('', line))
+        else:
+            entries[-1]['header'].append(line)
+    return entries
+
+
+def _header_parts(header_lines):
+    """Split entry header lines into date range and remaining text fragments."""
+    header = ' | '.join(header_lines)
+    dates = DATE_RANGE_RE.search(header)
+    if dates:
+        header = header[:dates.start()] + ' ' + header[dates.end():]
+    # Drop brackets left around the removed range, and bracketed dates such
+    # as the "(2019)" in our own "Uni (2019)" headings
+    header = BRACKETED_DATE_RE.sub(' ', header)
+    parts = [p.strip(' ,') for p in re.split(r'\s+\|\s+|\s+at\s+|\s+[–—-]\s+|,\s+|\t', header)]
+    return dates, [p for p in parts if p]
+
+
+def sections_to_resume_data(sections):
+    """Map split sections onto the frontend's resumeData shape."""
+    resume = empty_resume_data()
+    personal = resume["personal"]
+    contact = sections.get('Contact Information', '')
+
+    personal["fullName"] = sections.get('Name', '')
+    personal["summary"] = ' '.join(sections.get('Professional Summary', '').splitlines())
+    for field, pattern in (('email', EMAIL_RE), ('linkedin', LINKEDIN_RE), ('phone', PHONE_RE)):
+        match = pattern.search(contact)
+        if match:
+            personal[field] = match.group(0).strip()
+
+    for entry in _split_entries(sections.get('Work Experience', '')):
+        dates, parts = _header_parts(entry['header'])
+        end = dates.group(2) if dates else ''
+        resume["experiences"].append({
+            "title": parts[0] if parts else '',
+            "company": parts[1] if len(parts) > 1 else '',
+            "startDate": to_month_value(dates.group(1)) if dates else '',
+            "endDate": to_month_value(end),
+            "current": end.lower() in ('present', 'current', 'now'),
+            "description": '\n'.join(f"• {line}" for line in entry['body'])
+        })
+
+    for entry in _split_entries(sections.get('Education', '')):
+        _, parts = _header_parts(entry['header'])
+        degree = next((p for p in parts if DEGREE_RE.search(p)), '')
+        others = [p for p in parts if p != degree and not re.fullmatch(r'[\d\s]+', p)]
+        degree, _, field = degree.partition(' in ')
+        years = re.findall(r'\d{4}', ' '.join(entry['header']))
+        resume["education"].append({
+            "degree": degree.strip(),
+            "field": field.strip(),
+            "institution": others[0] if others else '',
+            "year": years[-1] if years else '',
+            "details": ' '.join(entry['body'])
+        })
+
+    skills = []
+    for line in sections.get('Skills', '').splitlines():
+        line = BULLET_RE.sub('', line)
+        if ':' in line and len(line.split(':', 1)[0]) < 30:
+            line = line.split(':', 1)[1]  # Drop category labels like "Languages:"
+        skills.extend(re.split(r'[,|;•·]', line))
+    resume["skills"] = ", ".join(skill_index.normalize(skills))
+
+    for entry in _split_entries(sections.get('Projects', '')):
+        _, parts = _header_parts(entry['header'])
+        resume["projectsList"].append({
+            "title": parts[0] if parts else '',
+            "description": ' '.join(entry['body'] + parts[1:])
+        })
+
+    return fit_resume(resume).to_dict()
+
+
+def parse_resume_file(data, extension, deadline):
+    """Extract and structure an uploaded resume, using the content-hash cache."""
+    digest = hashlib.sha256(data).hexdigest()
+    cached = parsed_resume_cache.get(digest)
+    if cached is not None:
+        return digest, cached, True
+
+    text = extract_pdf_text(data, deadline) if extension == 'pdf' else extract_docx_text(data)
+    sections = split_resume_sections(text)
+    parsed = {"sections": sections, "resume": sections_to_resume_data(sections)}
+
+    parsed_resume_cache.set(digest, parsed)
+    return digest, parsed, False
+
+
 def format_for_docx(text):
     """Format text into paragraphs for DOCX."""
     if not text:
@@ -385,13 +2730,18 @@ def format_for_docx(text):
             yield ' '.join(lines)
 
 
-def create_enhanced_docx(resume_data, filename=None):
-    """Create a professionally formatted DOCX resume."""
+@traced_allocations('create_enhanced_docx')
+def create_enhanced_docx(resume, filename=None):
+    """Create a professionally formatted DOCX resume from a Resume."""
     if not filename:
         filename = f"Resume_{uuid.uuid4().hex[:8]}.docx"
 
-    os.makedirs("generated", exist_ok=True)
-    filepath = os.path.join("generated", filename)
+    from docx import Document
+    from docx.shared import Pt, RGBColor
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    filepath = os.path.join(ARTIFACT_DIR, filename)
 
     doc = Document()
 
@@ -402,27 +2752,18 @@ def create_enhanced_docx(resume_data, filename=None):
     font.size = Pt(11)
 
     # Add name as title
-    name = resume_data.get('Name', '').strip()
+    name = resume.personal.full_name
     if name:
         title = doc.add_heading(name, level=0)
         title.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
-    # Section order
-    section_order = [
-        'Contact Information',
-        'Professional Summary',
-        'Work Experience',
-        'Education',
-        'Skills',
-        'Projects'
-    ]
+    sections = list(resume.sections())
+    contact = resume.personal.contact_line()
+    if contact:
+        sections.insert(0, ('Contact Information', contact))
 
     # Add sections
-    for section_name in section_order:
-        content = resume_data.get(section_name, '').strip()
-        if not content or content.startswith('['):
-            continue
-
+    for section_name, content in sections:
         # Add section heading
         heading = doc.add_heading(section_name, level=1)
         heading_format = heading.runs[0].font
@@ -438,13 +2779,21 @@ def create_enhanced_docx(resume_data, filename=None):
     return filepath
 
 
-def create_enhanced_pdf(resume_data, filename=None):
-    """Create a professionally formatted PDF resume."""
+@traced_allocations('create_enhanced_pdf')
+def create_enhanced_pdf(resume, filename=None):
+    """Create a professionally formatted PDF resume from a Resume."""
     if not filename:
         filename = f"Resume_{uuid.uuid4().hex[:8]}.pdf"
 
-    os.makedirs("generated", exist_ok=True)
-    filepath = os.path.join("generated", filename)
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.colors import HexColor
+
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    filepath = os.path.join(ARTIFACT_DIR, filename)
 
     doc = SimpleDocTemplate(filepath, pagesize=letter,
                             topMargin=0.5 * inch, bottomMargin=0.5 * inch,
@@ -497,33 +2846,20 @@ def create_enhanced_pdf(resume_data, filename=None):
     # Build document
     story = []
 
-    # Add name
-    name = resume_data.get('Name', '').strip()
+    # Add name (Paragraph parses markup, so user text is escaped)
+    name = resume.personal.full_name
     if name:
-        story.append(Paragraph(name, name_style))
+        story.append(Paragraph(escape(name), name_style))
 
     # Add contact information
-    contact = resume_data.get('Contact Information', '').strip()
+    contact = resume.personal.contact_line()
     if contact:
-        story.append(Paragraph(contact, contact_style))
+        story.append(Paragraph(escape(contact), contact_style))
 
     story.append(Spacer(1, 0.1 * inch))
 
-    # Section order
-    section_order = [
-        'Professional Summary',
-        'Work Experience',
-        'Education',
-        'Skills',
-        'Projects'
-    ]
-
     # Add sections
-    for section_name in section_order:
-        content = resume_data.get(section_name, '').strip()
-        if not content or content.startswith('['):
-            continue
-
+    for section_name, content in resume.sections():
         # Add section heading
         story.append(Paragraph(section_name, section_style))
 
@@ -537,7 +2873,9 @@ def create_enhanced_pdf(resume_data, filename=None):
 
             # Convert bullet points
             if line.startswith('•') or line.startswith('-'):
-                line = '&bull; ' + line[1:].strip()
+                line = '&bull; ' + escape(line[1:].strip())
+            else:
+                line = escape(line)
 
             story.append(Paragraph(line, body_style))
 
@@ -550,10 +2888,77 @@ def create_enhanced_pdf(resume_data, filename=None):
 
 
 # -----------------------------------------------------------------------------
-# Route: /
-# Method: GET
-# Purpose: Serve the main resume builder page
+# Static asset pipeline
+# Fingerprints and precompresses everything under static/ once at startup so
+# assets can be served with long-lived caching and conditional GET support.
 # -----------------------------------------------------------------------------
+STATIC_DIR = os.path.join(app.root_path, 'static')
+ASSET_MAX_AGE = 365 * 24 * 60 * 60  # Fingerprinted URLs never change content
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+
+asset_manifest = {}  # logical name (styles.css) -> fingerprinted name (styles.<hash>.css)
+asset_store = {}     # fingerprinted name -> {"mimetype", "etag", "variants"}
+
+
+def build_asset_manifest(static_dir=STATIC_DIR):
+    """Hash and precompress all static assets, replacing the current manifest."""
+    manifest, store = {}, {}
+
+    for root, _, files in os.walk(static_dir):
+        for fname in files:
+            path = os.path.join(root, fname)
+            logical = os.path.relpath(path, static_dir).replace(os.sep, '/')
+
+            with open(path, 'rb') as f:
+                data = f.read()
+
+            digest = hashlib.sha256(data).hexdigest()
+            stem, ext = os.path.splitext(logical)
+            fingerprinted = f"{stem}.{digest[:12]}{ext}"
+            mimetype = mimetypes.guess_type(logical)[0] or 'application/octet-stream'
+
+            # Only keep compressed variants that are actually smaller
+            variants = {'identity': data}
+            if mimetype.startswith(COMPRESSIBLE_TYPES):
+                gz = gzip.compress(data, compresslevel=9, mtime=0)
+                if len(gz) < len(data):
+                    variants['gzip'] = gz
+                if brotli:
+                    br = brotli.compress(data, quality=11)
+                    if len(br) < len(data):
+                        variants['br'] = br
+
+            manifest[logical] = fingerprinted
+            store[fingerprinted] = {
+                "mimetype": mimetype,
+                "etag": digest[:32],
+                "variants": variants
+            }
+
+    asset_manifest.clear()
+    asset_manifest.update(manifest)
+    asset_store.clear()
+    asset_store.update(store)
+    logger.info(f"Asset pipeline ready: {len(manifest)} files fingerprinted")
+
+
+def asset_url(filename):
+    """Return the fingerprinted URL for a static file, falling back to /static."""
+    fingerprinted = asset_manifest.get(filename)
+    if not fingerprinted:
+        return url_for('static', filename=filename)
+    return url_for('serve_asset', filename=fingerprinted)
+
+
+@app.context_processor
+def inject_asset_url():
+    """Expose asset_url() to templates."""
+    return {"asset_url": asset_url}
+
+
+build_asset_manifest()
+
+
 # -----------------------------------------------------------------------------
 # Route: /
 # Method: GET
@@ -562,7 +2967,41 @@ def create_enhanced_pdf(resume_data, filename=None):
 @app.route("/")
 def index():
     """Serve the main resume builder page."""
-    return render_template('index.html')
+    response = make_response(render_template('index.html'))
+    response.add_etag()
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+
+# -----------------------------------------------------------------------------
+# Route: /assets/<filename>
+# Method: GET
+# Purpose: Serve fingerprinted, precompressed static assets
+# -----------------------------------------------------------------------------
+@app.route("/assets/<path:filename>", methods=["GET"])
+def serve_asset(filename):
+    """Serve a fingerprinted static asset with the best available encoding."""
+    asset = asset_store.get(filename)
+    if not asset:
+        abort(404)
+
+    variants = asset["variants"]
+    encoding = 'identity'
+    for candidate in ('br', 'gzip'):
+        if candidate in variants and request.accept_encodings[candidate]:
+            encoding = candidate
+            break
+
+    response = make_response(variants[encoding])
+    response.mimetype = asset["mimetype"]
+    if encoding != 'identity':
+        response.content_encoding = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(f"{asset['etag']}-{encoding}")
+    response.cache_control.public = True
+    response.cache_control.max_age = ASSET_MAX_AGE
+    response.cache_control.immutable = True
+    return response.make_conditional(request)
 
 
 # -----------------------------------------------------------------------------
@@ -575,7 +3014,12 @@ def health():
     """Health check endpoint."""
     return jsonify({
         "status": "ok",
-        "groq_connected": client is not None,
+        "groq_configured": bool(GROQ_API_KEY),
+        # The client is created on the first LLM call; upstream reachability
+        # is reported by llm_circuit's last call outcome instead
+        "groq_client_initialized": client is not None,
+        "llm_circuit": llm_breaker.snapshot(),
+        "state_backend": state.name,
         "model": GROQ_MODEL
     }), 200
 
@@ -586,15 +3030,14 @@ def health():
 # Purpose: Enhance a specific section of the resume using AI
 # -----------------------------------------------------------------------------
 @app.route("/enhance", methods=["POST"])
+@rate_limited('llm')
+@json_payload(ENHANCE_MAX_BYTES)
+@scheduled('interactive')
 def enhance():
     """Enhance a specific resume section."""
     try:
-        data = request.get_json()
-        if not data:
-            return jsonify({"error": "No data provided"}), 400
-
-        section = data.get('section', '').strip()
-        content = data.get('content', '').strip()
+        payload = decode_struct(EnhanceRequest, g.payload)
+        section, content = payload.section, payload.content
 
         if not section or not content:
             return jsonify({"error": "Missing section or content"}), 400
@@ -608,67 +3051,132 @@ def enhance():
             "enhanced": enhanced
         }), 200
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except LLMUnavailableError as e:
+        logger.warning(f"Enhancement unavailable: {str(e)}")
+        return llm_error_response(e)
     except Exception as e:
         logger.error(f"Enhancement error: {str(e)}\n{traceback.format_exc()}")
         return jsonify({"error": str(e)}), 500
 
 
+# -----------------------------------------------------------------------------
+# Route: /enhance_items
+# Method: POST
+# Purpose: Enhance experiences or projects individually, in parallel
+# -----------------------------------------------------------------------------
+@app.route("/enhance_items", methods=["POST"])
+@rate_limited('llm')
+@json_payload(RESUME_MAX_BYTES)
+@scheduled('interactive')
+def enhance_items_route():
+    """Enhance each experience or project as its own cached unit."""
+    try:
+        data = g.payload
+        if not isinstance(data, dict) or not data:
+            return jsonify({"error": "No data provided"}), 400
+
+        section = str(data.get('section', '')).lower().strip()
+        items = data.get('items')
+        if section not in ITEM_FIELDS or not isinstance(items, list) or not items:
+            return jsonify({"error": "Provide section ('experience' or 'projects') and a non-empty items list"}), 400
+
+        if not get_groq_client():
+            return jsonify({"error": "AI service is not configured", "status": "llm_unavailable"}), 503
+
+        return jsonify({
+            "success": True,
+            "section": section,
+            "items": enhance_items(section, items)
+        }), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except LLMUnavailableError as e:
+        logger.warning(f"Item enhancement unavailable: {str(e)}")
+        return llm_error_response(e)
+    except Exception as e:
+        logger.error(f"Item enhancement error: {str(e)}\n{traceback.format_exc()}")
+        return jsonify({"error": str(e)}), 500
+
+
 # -----------------------------------------------------------------------------
 # Route: /generate_resume
 # Method: POST
 # Purpose: Generate a complete resume with AI enhancements
 # -----------------------------------------------------------------------------
 @app.route("/generate_resume", methods=["POST"])
+@json_payload(RESUME_MAX_BYTES)
+@scheduled('rendering')
 def generate_resume():
     """Generate enhanced resume in both DOCX and PDF formats."""
     try:
-        resume_data = request.get_json()
-        if not resume_data:
+        resume = decode_resume(g.payload)
+        if resume.is_empty():
             return jsonify({"error": "No resume data provided"}), 400
 
         logger.info("Generating enhanced resume")
 
-        # Create both formats
-        docx_path = create_enhanced_docx(resume_data)
-        pdf_path = create_enhanced_pdf(resume_data)
+        # Create both formats and hand them to the shared artifact store
+        docx = state.save_artifact(create_enhanced_docx(resume), 'docx')
+        pdf = state.save_artifact(create_enhanced_pdf(resume), 'pdf')
 
         return jsonify({
             "success": True,
             "message": "Resume generated successfully",
-            "docx": os.path.basename(docx_path),
-            "pdf": os.path.basename(pdf_path)
+            "docx": docx["name"],
+            "pdf": pdf["name"]
         }), 200
 
+    except PayloadError as e:
+        return jsonify({"error": str(e)}), e.status_code
     except Exception as e:
         logger.error(f"Resume generation error: {str(e)}\n{traceback.format_exc()}")
         return jsonify({"error": str(e)}), 500
 
 
+ARTIFACT_MIMETYPES = {
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'pdf': 'application/pdf',
+}
+
+
+def send_artifact(kind):
+    """Send the artifact named by ?name=, as returned by /generate_resume."""
+    name = request.args.get('name')
+    if not name:
+        return jsonify({"error": "Missing file name, generate the resume first"}), 400
+    if not ARTIFACT_NAME_RE.fullmatch(name) or not name.endswith(f".{kind}"):
+        return jsonify({"error": "Invalid file name"}), 400
+    meta = state.artifact_info(name)
+    if not meta:
+        return jsonify({"error": "Resume not found"}), 404
+
+    # Answer revalidation without fetching the file from the backend
+    if request.if_none_match.contains(meta["etag"]):
+        response = make_response('', 304)
+        response.set_etag(meta["etag"])
+        return response
+
+    artifact = state.open_artifact(meta["name"])
+    if artifact is None:
+        return jsonify({"error": "Resume has expired, please generate it again"}), 404
+
+    return send_file(artifact, mimetype=ARTIFACT_MIMETYPES[kind], as_attachment=True,
+                     download_name=f"Enhanced_Resume.{kind}", etag=meta["etag"])
+
+
 # -----------------------------------------------------------------------------
 # Route: /download
 # Method: GET
-# Purpose: Download the most recently generated resume in DOCX format.
+# Purpose: Download a generated resume in DOCX format (?name= from /generate_resume)
 # -----------------------------------------------------------------------------
 @app.route("/download", methods=["GET"])
 def download():
-    """Download the most recent resume in DOCX format."""
+    """Download a generated resume in DOCX format."""
     try:
-        # Check if the 'generated' directory exists
-        if not os.path.exists('generated'):
-            # If not, return a 404 error with a message
-            return jsonify({"error": "No resumes generated yet"}), 404
-
-        # List all files in 'generated' that end with .docx (Word files)
-        files = [f for f in os.listdir('generated') if f.endswith('.docx')]
-        if not files:
-            # If no DOCX files found, return a 404 error
-            return jsonify({"error": "No resume found"}), 404
-
-        # Find the most recently created DOCX file (by creation time)
-        latest = max([os.path.join('generated', f) for f in files], key=os.path.getctime)
-        # Send the file as a download with a user-friendly filename
-        return send_file(latest, as_attachment=True, download_name='Enhanced_Resume.docx')
-
+        return send_artifact('docx')
     except Exception as e:
         # Log any errors and return a 500 error with the error message
         logger.error(f"Download error: {str(e)}")
@@ -678,26 +3186,13 @@ def download():
 # -----------------------------------------------------------------------------
 # Route: /download_pdf
 # Method: GET
-# Purpose: Download the most recently generated resume in PDF format.
+# Purpose: Download a generated resume in PDF format (?name= from /generate_resume)
 # -----------------------------------------------------------------------------
 @app.route("/download_pdf", methods=["GET"])
 def download_pdf():
-    """Download the most recent resume in PDF format."""
+    """Download a generated resume in PDF format."""
     try:
-        # Check if the 'generated' directory exists
-        if not os.path.exists('generated'):
-            return jsonify({"error": "No resumes generated yet"}), 404
-
-        # List all files in 'generated' that end with .pdf
-        files = [f for f in os.listdir('generated') if f.endswith('.pdf')]
-        if not files:
-            return jsonify({"error": "No PDF resume found"}), 404
-
-        # Find the most recently created PDF file
-        latest = max([os.path.join('generated', f) for f in files], key=os.path.getctime)
-        # Send the file as a download with a user-friendly filename
-        return send_file(latest, as_attachment=True, download_name='Enhanced_Resume.pdf')
-
+        return send_artifact('pdf')
     except Exception as e:
         logger.error(f"Download PDF error: {str(e)}")
         return jsonify({"error": str(e)}), 500
@@ -706,75 +3201,131 @@ def download_pdf():
 # -----------------------------------------------------------------------------
 # Route: /import_linkedin
 # Method: POST
-# Purpose: Import profile data from LinkedIn URL or public profile
+# Purpose: Import profile data from a LinkedIn data export ZIP or saved profile page
 # -----------------------------------------------------------------------------
 @app.route("/import_linkedin", methods=["POST"])
+@scheduled('bulk')
 def import_linkedin():
-    """Import LinkedIn profile data (simplified version using public data)."""
+    """Import a LinkedIn data export (ZIP) or saved profile page (HTML)."""
     try:
-        data = request.json
-        linkedin_url = data.get("linkedin_url", "")
-        
-        if not linkedin_url:
-            return jsonify({"error": "LinkedIn URL is required"}), 400
-        
-        # Note: This is a simplified implementation
-        # For production, you'd use LinkedIn API with OAuth
-        # For now, we'll use AI to extract data from user-provided info
-        
-        profile_data = {
-            "name": "",
-            "headline": "",
-            "summary": "",
-            "experience": [],
-            "education": [],
-            "skills": [],
+        if request.content_length is None:
+            return jsonify({"error": "Content-Length is required"}), 411
+        if request.content_length > IMPORT_MAX_BYTES:
+            return jsonify({"error": f"Upload exceeds {IMPORT_MAX_BYTES // (1024 * 1024)}MB limit"}), 413
+
+        upload = request.files.get('file')
+        if not upload or not upload.filename:
+            return jsonify({
+                "error": "Upload your LinkedIn data export (.zip) or saved profile page (.html) as 'file'"
+            }), 400
+
+        deadline = time.monotonic() + IMPORT_TIME_LIMIT
+        started = time.perf_counter()
+        stream = upload.stream
+
+        if zipfile.is_zipfile(stream):
+            stream.seek(0)
+            source = "zip"
+            resume = parse_linkedin_export(stream, deadline)
+        else:
+            stream.seek(0)
+            source = "html"
+            resume = parse_linkedin_html(stream, deadline)
+
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(f"LinkedIn {source} import parsed in {elapsed_ms}ms "
+                    f"({len(resume['experiences'])} positions, {len(resume['education'])} schools)")
+
+        return jsonify({
+            "success": True,
             "imported": True,
-            "message": "LinkedIn integration ready. Please manually enter your information or use the AI enhancement feature."
-        }
-        
-        return jsonify(profile_data), 200
-        
+            "source": source,
+            "resume": resume,
+            "parse_ms": elapsed_ms
+        }), 200
+
+    except ImportLimitError as e:
+        logger.warning(f"LinkedIn import rejected: {str(e)}")
+        return jsonify({"error": str(e)}), 413
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except zipfile.BadZipFile as e:
+        return jsonify({"error": f"Invalid ZIP archive: {str(e)}"}), 400
     except Exception as e:
-        logger.error(f"LinkedIn import error: {str(e)}")
+        logger.error(f"LinkedIn import error: {str(e)}\n{traceback.format_exc()}")
         return jsonify({"error": str(e)}), 500
 
 
+# -----------------------------------------------------------------------------
+# Route: /parse_resume
+# Method: POST
+# Purpose: Parse an existing DOCX/PDF resume into structured sections
+# -----------------------------------------------------------------------------
+@app.route("/parse_resume", methods=["POST"])
+@scheduled('bulk')
+def parse_resume():
+    """Extract sections from an uploaded resume without calling the LLM."""
+    try:
+        if request.content_length is None:
+            return jsonify({"error": "Content-Length is required"}), 411
+        if request.content_length > RESUME_UPLOAD_MAX_BYTES:
+            return jsonify({"error": f"Upload exceeds {RESUME_UPLOAD_MAX_BYTES // (1024 * 1024)}MB limit"}), 413
+
+        upload = request.files.get('file')
+        if not upload or not upload.filename:
+            return jsonify({"error": "Upload a .docx or .pdf resume as 'file'"}), 400
+
+        extension = upload.filename.rsplit('.', 1)[-1].lower()
+        if extension not in ('docx', 'pdf'):
+            return jsonify({"error": "Only .docx and .pdf files are supported"}), 415
+
+        started = time.perf_counter()
+        deadline = time.monotonic() + RESUME_PARSE_TIME_LIMIT
+        digest, parsed, cached = parse_resume_file(upload.read(), extension, deadline)
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(f"Parsed {extension} resume {digest[:12]} in {elapsed_ms}ms (cached: {cached})")
+
+        return jsonify({
+            "success": True,
+            "sha256": digest,
+            "cached": cached,
+            "sections": parsed["sections"],
+            "resume": parsed["resume"],
+            "parse_ms": elapsed_ms
+        }), 200
+
+    except ImportLimitError as e:
+        logger.warning(f"Resume parse rejected: {str(e)}")
+        return jsonify({"error": str(e)}), 413
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except BrokenExecutor as e:
+        logger.error(f"PDF worker pool failed: {str(e)}")
+        return jsonify({"error": "PDF extraction failed, please try again"}), 500
+    except RuntimeError as e:
+        logger.error(f"Resume parse error: {str(e)}")
+        return jsonify({"error": str(e)}), 501
+    except Exception as e:
+        logger.warning(f"Resume parse failed: {type(e).__name__}: {str(e)}")
+        return jsonify({"error": "Could not read this file. Is it a valid DOCX or PDF?"}), 400
+
+
 # -----------------------------------------------------------------------------
 # Route: /analyze_resume
 # Method: POST
 # Purpose: Analyze resume content and provide scoring with recommendations
 # -----------------------------------------------------------------------------
 @app.route("/analyze_resume", methods=["POST"])
+@rate_limited('llm')
+@json_payload(RESUME_MAX_BYTES)
+@scheduled('analysis')
 def analyze_resume():
     """Analyze resume and provide comprehensive scoring with recommendations."""
     try:
-        data = request.json
-        
-        # Extract resume data
-        personal_info = data.get("personalInfo", {})
-        experiences = data.get("experience", [])
-        education = data.get("education", [])
-        skills = data.get("skills", [])
-        
-        # Prepare analysis prompt
-        resume_content = f"""
-Personal Information:
-- Name: {personal_info.get('fullName', 'Not provided')}
-- Email: {personal_info.get('email', 'Not provided')}
-- Phone: {personal_info.get('phone', 'Not provided')}
-- LinkedIn: {personal_info.get('linkedin', 'Not provided')}
-- Summary: {personal_info.get('summary', 'Not provided')}
+        resume = decode_resume(g.payload)
 
-Work Experience ({len(experiences)} entries):
-{chr(10).join([f"- {exp.get('title', '')} at {exp.get('company', '')} ({exp.get('startDate', '')} - {exp.get('endDate', '')})" for exp in experiences])}
-
-Education ({len(education)} entries):
-{chr(10).join([f"- {edu.get('degree', '')} in {edu.get('field', '')} from {edu.get('school', '')}" for edu in education])}
-
-Skills ({len(skills)} skills):
-{', '.join(skills)}
-"""
+        # Prepare analysis prompt
+        resume_content = resume.analysis_text()
 
         analysis_prompt = f"""You are an expert resume reviewer and career coach. Analyze the following resume and provide a comprehensive scoring and recommendations.
 
@@ -804,7 +3355,7 @@ Provide your analysis in the following JSON format:
 Be specific, actionable, and constructive in your feedback. Focus on ATS optimization, quantifiable achievements, and professional presentation.
 """
 
-        if not client:
+        if not get_groq_client():
             # Fallback scoring when AI is not available
             return jsonify({
                 "overallScore": 75,
@@ -817,8 +3368,8 @@ Be specific, actionable, and constructive in your feedback. Focus on ATS optimiz
                 },
                 "strengths": [
                     "Clear contact information provided",
-                    f"{len(experiences)} work experience entries included",
-                    f"{len(skills)} skills listed"
+                    f"{len(resume.experiences)} work experience entries included",
+                    f"{len(resume.skills)} skills listed"
                 ],
                 "improvements": [
                     "Add AI-enhanced content for better impact",
@@ -835,9 +3386,8 @@ Be specific, actionable, and constructive in your feedback. Focus on ATS optimiz
             }), 200
 
         # Get AI analysis
-        response = client.chat.completions.create(
-            model=GROQ_MODEL,
-            messages=[
+        response = call_llm(
+            [
                 {"role": "system", "content": "You are an expert resume reviewer. Provide detailed, actionable feedback in valid JSON format only."},
                 {"role": "user", "content": analysis_prompt}
             ],
@@ -845,13 +3395,14 @@ Be specific, actionable, and constructive in your feedback. Focus on ATS optimiz
             max_tokens=2000
         )
 
-        ai_response = response.choices[0].message.content.strip()
-        
-        # Extract JSON from response
-        json_match = re.search(r'\{[\s\S]*\}', ai_response)
-        if json_match:
-            analysis_result = json.loads(json_match.group())
-        else:
+        with allocation_trace('groq_response'):
+            ai_response = response.choices[0].message.content.strip()
+
+            # Extract JSON from response
+            json_match = re.search(r'\{[\s\S]*\}', ai_response)
+            analysis_result = json.loads(json_match.group()) if json_match else None
+
+        if analysis_result is None:
             # Fallback if JSON parsing fails
             analysis_result = {
                 "overallScore": 75,
@@ -876,11 +3427,151 @@ Be specific, actionable, and constructive in your feedback. Focus on ATS optimiz
         logger.info(f"Resume analyzed with overall score: {analysis_result.get('overallScore', 'N/A')}")
         return jsonify(analysis_result), 200
 
+    except PayloadError as e:
+        return jsonify({"error": str(e)}), e.status_code
+    except LLMUnavailableError as e:
+        logger.warning(f"Resume analysis unavailable: {str(e)}")
+        return llm_error_response(e)
     except Exception as e:
         logger.error(f"Resume analysis error: {str(e)}\n{traceback.format_exc()}")
         return jsonify({"error": str(e)}), 500
 
 
+# -----------------------------------------------------------------------------
+# Route: /skills/suggest
+# Method: GET
+# Purpose: Autocomplete skills from the local canonical skills index
+# -----------------------------------------------------------------------------
+@app.route("/skills/suggest", methods=["GET"])
+def suggest_skills():
+    """Suggest canonical skills for a typed prefix."""
+    query = request.args.get('q', '')[:100]
+    try:
+        limit = min(max(int(request.args.get('limit', 8)), 1), 25)
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    response = jsonify({
+        "query": query,
+        "suggestions": skill_index.suggest(query, limit)
+    })
+    # The catalog only changes on deploy, so browsers may reuse answers
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response
+
+
+# -----------------------------------------------------------------------------
+# Route: /skills/normalize
+# Method: POST
+# Purpose: Map free-form skills to canonical names and remove duplicates
+# -----------------------------------------------------------------------------
+@app.route("/skills/normalize", methods=["POST"])
+def normalize_skills():
+    """Normalize a comma-separated string or list of skills."""
+    data = request.get_json(silent=True) or {}
+    skills = data.get('skills', '')
+    if isinstance(skills, str):
+        skills = skills.split(',')
+    if not isinstance(skills, list) or not all(isinstance(s, str) for s in skills):
+        return jsonify({"error": "skills must be a string or list of strings"}), 400
+    if len(skills) > 200:
+        return jsonify({"error": "Too many skills"}), 400
+
+    normalized = skill_index.normalize(skills)
+    return jsonify({
+        "skills": normalized,
+        "text": ", ".join(normalized)
+    }), 200
+
+
+# -----------------------------------------------------------------------------
+# Route: /admin/profile
+# Method: GET, POST
+# Purpose: Inspect or reconfigure the request sampling profiler (admin only)
+# -----------------------------------------------------------------------------
+@app.route("/admin/profile", methods=["GET", "POST"])
+@admin_required
+def admin_profile():
+    """Return folded stacks (GET) or update the sample rate (POST)."""
+    if request.method == "POST":
+        data = request.get_json(silent=True) or {}
+        if data.get('reset'):
+            profiler.reset()
+        if 'sample_rate' in data:
+            try:
+                rate = float(data['sample_rate'])
+            except (TypeError, ValueError):
+                return jsonify({"error": "sample_rate must be a number"}), 400
+            profiler.sample_rate = min(max(rate, 0.0), 1.0)
+            logger.info(f"Profiler sample rate set to {profiler.sample_rate}")
+        return jsonify(profiler.stats()), 200
+
+    if request.args.get('format') == 'json':
+        return jsonify(profiler.stats()), 200
+
+    response = make_response(profiler.folded(request.args.get('endpoint')))
+    response.mimetype = 'text/plain'
+    return response
+
+
+# -----------------------------------------------------------------------------
+# Route: /admin/scheduler
+# Method: GET
+# Purpose: Queue depth, concurrency and wait-time metrics per priority class
+# -----------------------------------------------------------------------------
+@app.route("/admin/scheduler", methods=["GET"])
+@admin_required
+def admin_scheduler():
+    """Return request scheduler metrics."""
+    return jsonify(scheduler.stats()), 200
+
+
+# -----------------------------------------------------------------------------
+# Route: /admin/allocations
+# Method: GET, POST
+# Purpose: Control tracemalloc and read allocation reports (admin only)
+# -----------------------------------------------------------------------------
+@app.route("/admin/allocations", methods=["GET", "POST"])
+@admin_required
+def admin_allocations():
+    """Start/stop tracemalloc (POST) or return recorded allocation diffs (GET)."""
+    if request.method == "POST":
+        data = request.get_json(silent=True) or {}
+        if data.get('enabled') and not tracemalloc.is_tracing():
+            try:
+                frames = int(data.get('frames', 1))
+            except (TypeError, ValueError):
+                return jsonify({"error": "frames must be an integer"}), 400
+            if not 1 <= frames <= 100:
+                return jsonify({"error": "frames must be between 1 and 100"}), 400
+            tracemalloc.start(frames)
+            logger.info("tracemalloc started")
+        elif 'enabled' in data and not data['enabled'] and tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("tracemalloc stopped")
+        if data.get('reset'):
+            with allocation_lock:
+                allocation_reports.clear()
+
+    with allocation_lock:
+        reports = {label: list(items) for label, items in allocation_reports.items()}
+
+    current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+    return jsonify({
+        "tracing": tracemalloc.is_tracing(),
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "reports": reports
+    }), 200
+
+
+# Pre-fork servers (gunicorn --preload) import this module once in the master;
+# preloading there lets every worker share the heavy modules
+if os.getenv('PRELOAD_DEPENDENCIES', '').lower() in ('1', 'true', 'yes'):
+    warm_up()
+
+
 # -----------------------------------------------------------------------------
 # Main entry point for running the Flask app
 # -----------------------------------------------------------------------------
@@ -893,10 +3584,12 @@ if __name__ == "__main__":
     print("=" * 70)
     print(f"  Model: {GROQ_MODEL}")
     print(f"  API Key: {'Configured' if GROQ_API_KEY else 'Missing'}")
-    print(f"  Groq Client: {'Connected' if client else 'Failed'}")
+    print(f"  Groq Client: {'Connected' if check_groq_connection() else 'Failed'}")
     print(f"  Server: http://localhost:{PORT}")
     print(f"  Health Check: http://localhost:{PORT}/health")
     print("=" * 70)
 
-    # Start the Flask development server, accessible on all network interfaces
-    app.run(debug=True, host='0.0.0.0', port=PORT)
\ No newline at end of file
+    # Start the Flask development server, accessible on all network interfaces.
+    # Static files are fingerprinted at startup, so restart when they change.
+    static_files = [os.path.join(STATIC_DIR, name) for name in asset_manifest]
+    app.run(debug=True, host='0.0.0.0', port=PORT, extra_files=static_files)
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""Guard the cold-start cost of importing app.py.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 5] [--budget-ms 400]
+
+Runs `python -X importtime -c "import app"` in fresh interpreters and reports
+the cumulative import time of the app module. Exits non-zero when the median
+exceeds the budget or when any of the heavy dependencies that should load
+lazily (groq, docx, reportlab, bs4, pypdf, requests) is imported eagerly.
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+LAZY_ROOTS = ('groq', 'docx', 'reportlab', 'bs4', 'pypdf', 'requests')
+LINE_RE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)$')
+
+
+def measure():
+    """Return (cumulative app import time in ms, set of imported module names)."""
+    env = dict(os.environ, GROQ_API_KEY='', PRELOAD_DEPENDENCIES='0')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import app'],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    app_us = None
+    modules = set()
+    for line in result.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if not match:
+            continue
+        modules.add(match.group(4))
+        if match.group(4) == 'app':
+            app_us = int(match.group(2))
+    return app_us / 1000, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=400.0)
+    args = parser.parse_args()
+
+    timings = []
+    eager = set()
+    for _ in range(args.runs):
+        elapsed, modules = measure()
+        timings.append(elapsed)
+        eager.update(m for m in modules if m.split('.')[0] in LAZY_ROOTS)
+
+    median = statistics.median(timings)
+    print(f"import app: median {median:.1f} ms, min {min(timings):.1f} ms over {args.runs} runs "
+          f"(budget {args.budget_ms:.0f} ms)")
+
+    failed = False
+    if eager:
+        print(f"FAIL: imported eagerly: {', '.join(sorted(eager))}")
+        failed = True
+    if median > args.budget_ms:
+        print("FAIL: import time over budget")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Benchmark the LinkedIn data export importer on a large synthetic export.
+
+Usage:
+    python benchmarks/bench_linkedin_import.py [--positions 5000] [--stream-mb 9] [--messages-mb 50]
+
+Reports wall time and peak Python heap usage of parse_linkedin_export(). Only
+RESUME_MAX_ENTRIES positions are kept, so the bulk of the work is streaming
+"Email Addresses.csv", which is read to the end and sized just under the
+per-member cap. The peak should stay flat as that member grows, since rows
+are decoded one at a time and unused files (messages) are never read.
+
+Also checks that a member over IMPORT_MAX_MEMBER_BYTES and an expired
+deadline are both rejected with ImportLimitError without reading the export.
+"""
+import argparse
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import app  # noqa: E402
+
+
+def write_csv(zf, name, header, rows):
+    with zf.open(name, 'w') as raw:
+        text = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+        writer = csv.writer(text)
+        writer.writerow(header)
+        writer.writerows(rows)
+        text.flush()
+        text.detach()
+
+
+def email_rows(target_bytes):
+    """Secondary addresses up to roughly target_bytes, with the primary one last."""
+    written = 0
+    i = 0
+    while written < target_bytes:
+        row = [f'jane.doe.alias{i}@example.com', 'Yes', 'No']
+        written += sum(len(field) for field in row) + 4
+        i += 1
+        yield row
+    yield ['jane@example.com', 'Yes', 'Yes']
+
+
+def build_export(path, positions, stream_mb, messages_mb):
+    description = "Led cross-functional initiatives and shipped features to production. " * 8
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        write_csv(zf, 'Profile.csv',
+                  ['First Name', 'Last Name', 'Headline', 'Summary', 'Geo Location'],
+                  [['Jane', 'Doe', 'Senior Engineer', description, 'Berlin, Germany']])
+        write_csv(zf, 'Email Addresses.csv', ['Email Address', 'Confirmed', 'Primary'],
+                  email_rows(stream_mb * 1024 * 1024))
+        write_csv(zf, 'Positions.csv',
+                  ['Company Name', 'Title', 'Description', 'Location', 'Started On', 'Finished On'],
+                  ([f'Company {i}', f'Engineer {i}', description, 'Remote', 'Jan 2015', 'Mar 2018']
+                   for i in range(positions)))
+        write_csv(zf, 'Education.csv',
+                  ['School Name', 'Start Date', 'End Date', 'Notes', 'Degree Name', 'Activities'],
+                  [['State University', '2010', '2014', '', 'Bachelor of Science', '']])
+        write_csv(zf, 'Skills.csv', ['Name'], ([f'Skill {i}'] for i in range(positions)))
+        line = 'Conversation,From,To,Date,Content\n'
+        with zf.open('messages.csv', 'w') as raw:
+            chunk = (line * 10000).encode()
+            for _ in range(max(1, messages_mb * 1024 * 1024 // len(chunk))):
+                raw.write(chunk)
+
+
+def build_oversized_export(path):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        write_csv(zf, 'Positions.csv', ['Company Name', 'Title', 'Description'],
+                  (['Company', 'Engineer', 'x' * 1000] for _ in range(app.IMPORT_MAX_MEMBER_BYTES // 1000 + 1)))
+
+
+def expect_rejection(label, path, deadline):
+    started = time.perf_counter()
+    try:
+        with open(path, 'rb') as f:
+            app.parse_linkedin_export(f, deadline)
+    except app.ImportLimitError as e:
+        print(f"{label}: rejected in {(time.perf_counter() - started) * 1000:.1f} ms ({e})")
+    else:
+        raise SystemExit(f"{label}: expected ImportLimitError")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--positions', type=int, default=5000)
+    parser.add_argument('--stream-mb', type=int, default=9,
+                        help="size of the fully read Email Addresses.csv (cap is "
+                             f"{app.IMPORT_MAX_MEMBER_BYTES // (1024 * 1024)} MB)")
+    parser.add_argument('--messages-mb', type=int, default=50)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'export.zip')
+        build_export(path, args.positions, args.stream_mb, args.messages_mb)
+        print(f"Export size: {os.path.getsize(path) / 1024:.0f} KB "
+              f"({args.positions} positions, {args.stream_mb} MB streamed member, "
+              f"{args.messages_mb} MB messages uncompressed)")
+
+        timings = []
+        for _ in range(args.runs):
+            with open(path, 'rb') as f:
+                started = time.perf_counter()
+                resume = app.parse_linkedin_export(f, time.monotonic() + app.IMPORT_TIME_LIMIT)
+                timings.append(time.perf_counter() - started)
+
+        tracemalloc.start()
+        with open(path, 'rb') as f:
+            app.parse_linkedin_export(f, time.monotonic() + app.IMPORT_TIME_LIMIT)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        expect_rejection("Expired deadline", path, time.monotonic() - 1)
+        oversized = os.path.join(tmp, 'oversized.zip')
+        build_oversized_export(oversized)
+        expect_rejection("Oversized member", oversized, time.monotonic() + app.IMPORT_TIME_LIMIT)
+
+    timings.sort()
+    print(f"Kept {len(resume['experiences'])} of {args.positions} positions "
+          f"(RESUME_MAX_ENTRIES={app.RESUME_MAX_ENTRIES}) and {len(resume['skills'].split(', '))} skills "
+          f"(RESUME_MAX_SKILLS={app.RESUME_MAX_SKILLS}), "
+          f"primary email {resume['personal']['email']}")
+    print(f"min {timings[0] * 1000:.1f} ms / median {timings[len(timings) // 2] * 1000:.1f} ms")
+    print(f"peak traced memory: {peak / 1024:.0f} KB")
+
+
+if __name__ == '__main__':
+    main()
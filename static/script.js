@@ -61,11 +61,11 @@ async function generateAndDownload() {
         showToast('Resume generated! Downloads will start shortly.', 'success');
 
         // Trigger DOCX download by navigating to the download URL.
-        window.location.href = `${API_BASE_URL}/download`;
+        window.location.href = `${API_BASE_URL}/download?name=${encodeURIComponent(result.docx)}`;
 
         // Trigger PDF download after a short delay to ensure both start.
         setTimeout(() => {
-            window.location.href = `${API_BASE_URL}/download_pdf`;
+            window.location.href = `${API_BASE_URL}/download_pdf?name=${encodeURIComponent(result.pdf)}`;
         }, 1000);
 
     } catch (error) {
@@ -112,14 +112,7 @@ async function enhanceSection(sectionName) {
             content = fieldElement.value.trim();
             break;
         case 'projects':
-            if (resumeData.projectsList.length === 0) {
-                showToast('Please add at least one project first', 'error');
-                return;
-            }
-            content = resumeData.projectsList.map(p =>
-                `Title: ${p.title}\nDescription: ${p.description}`
-            ).join('\n---\n');
-            break;
+            return enhanceProjects();
     }
 
     if (!content) {
@@ -142,63 +135,16 @@ async function enhanceSection(sectionName) {
             })
         });
 
+        const data = await response.json();
+
         if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
+            showToast(data.error || `Enhancement failed (HTTP ${response.status})`, 'error');
+            return;
         }
 
-        const data = await response.json();
-
         if (data.success) {
-            if (sectionName === 'projects') {
-                try {
-                    // Try to parse as JSON first
-                    let enhanced;
-                    if (data.enhanced.trim().startsWith('[') || data.enhanced.trim().startsWith('{')) {
-                        enhanced = JSON.parse(data.enhanced);
-                    } else {
-                        // Parse text format
-                        const projects = data.enhanced.split('---').map(proj => {
-                            const lines = proj.trim().split('\n');
-                            let title = '';
-                            let description = '';
-
-                            lines.forEach(line => {
-                                if (line.toLowerCase().startsWith('title:')) {
-                                    title = line.substring(line.indexOf(':') + 1).trim();
-                                } else if (line.toLowerCase().startsWith('description:')) {
-                                    description = line.substring(line.indexOf(':') + 1).trim();
-                                } else if (description) {
-                                    description += ' ' + line.trim();
-                                }
-                            });
-
-                            return { title, description };
-                        }).filter(p => p.title || p.description);
-
-                        enhanced = projects;
-                    }
-
-                    const projectItems = document.querySelectorAll('#projectsContainer .dynamic-item');
-                    enhanced.forEach((proj, idx) => {
-                        if (projectItems[idx]) {
-                            if (proj.title) {
-                                projectItems[idx].querySelector('.proj-title').value = proj.title;
-                            }
-                            if (proj.description) {
-                                projectItems[idx].querySelector('.proj-description').value = proj.description;
-                            }
-                        }
-                    });
-                    updateProjectData();
-                } catch (parseError) {
-                    console.error('Parse error:', parseError);
-                    showToast('Error parsing enhanced projects. Try again.', 'error');
-                    return;
-                }
-            } else {
-                fieldElement.value = data.enhanced;
-                updateResumeData();
-            }
+            fieldElement.value = data.enhanced;
+            updateResumeData();
             showToast(`${sectionName.charAt(0).toUpperCase() + sectionName.slice(1)} enhanced successfully!`);
         } else {
             showToast(data.error || 'Enhancement failed', 'error');
@@ -212,6 +158,55 @@ async function enhanceSection(sectionName) {
     }
 }
 
+// Enhance experiences or projects item by item. The server caches each item
+// by content, so unchanged items come back without another AI call.
+async function requestItemEnhancement(section, items) {
+    const response = await fetch(`${API_BASE_URL}/enhance_items`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ section, items })
+    });
+    const data = await response.json();
+    if (!response.ok || !data.success) {
+        throw new Error(data.error || `Enhancement failed (HTTP ${response.status})`);
+    }
+    return data.items;
+}
+
+async function enhanceProjects() {
+    if (resumeData.projectsList.length === 0) {
+        showToast('Please add at least one project first', 'error');
+        return;
+    }
+
+    try {
+        isEnhancing = true;
+        showLoading(true);
+
+        const enhanced = await requestItemEnhancement('projects', resumeData.projectsList);
+        const projectItems = document.querySelectorAll('#projectsContainer .dynamic-item');
+        enhanced.forEach((proj, idx) => {
+            if (!projectItems[idx] || proj.error) return;
+            if (proj.title) projectItems[idx].querySelector('.proj-title').value = proj.title;
+            if (proj.description) projectItems[idx].querySelector('.proj-description').value = proj.description;
+        });
+        updateProjectData();
+
+        const failed = enhanced.filter(p => p.error).length;
+        if (failed) {
+            showToast(`${failed} project(s) could not be enhanced. Try again.`, 'error');
+        } else {
+            showToast('Projects enhanced successfully!');
+        }
+    } catch (error) {
+        console.error('Enhancement error:', error);
+        showToast(error.message, 'error');
+    } finally {
+        isEnhancing = false;
+        showLoading(false);
+    }
+}
+
 // Enhance individual experience description
 async function enhanceExperienceDescription(button) {
     if (isEnhancing) {
@@ -233,33 +228,20 @@ async function enhanceExperienceDescription(button) {
         button.disabled = true;
         button.textContent = 'Enhancing...';
 
-        const response = await fetch(`${API_BASE_URL}/enhance`, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
-            body: JSON.stringify({
-                section: 'experience',
-                content: content
-            })
-        });
-
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
-        }
-
-        const data = await response.json();
+        const index = Array.from(experienceItem.parentNode.children).indexOf(experienceItem);
+        const experience = { ...resumeData.experiences[index], description: content };
+        const [enhanced] = await requestItemEnhancement('experience', [experience]);
 
-        if (data.success) {
-            descriptionField.value = data.enhanced;
+        if (enhanced.error) {
+            showToast(enhanced.error, 'error');
+        } else {
+            descriptionField.value = enhanced.description;
             updateExperienceData();
             showToast('Experience description enhanced!');
-        } else {
-            showToast(data.error || 'Enhancement failed', 'error');
         }
     } catch (error) {
         console.error('Enhancement error:', error);
-        showToast('Failed to enhance. Check if backend is running.', 'error');
+        showToast(error.message, 'error');
     } finally {
         isEnhancing = false;
         button.disabled = false;
@@ -770,6 +752,102 @@ function updateSkillsPreview() {
     }
 }
 
+// Skills autocomplete backed by the server-side skills index
+const skillSuggestionCache = new Map();
+let skillSuggestTimer = null;
+
+function currentSkillToken(field) {
+    const beforeCaret = field.value.slice(0, field.selectionStart);
+    return beforeCaret.slice(beforeCaret.lastIndexOf(',') + 1).trim();
+}
+
+function suggestSkills() {
+    clearTimeout(skillSuggestTimer);
+    skillSuggestTimer = setTimeout(async () => {
+        const field = document.getElementById('skills');
+        const token = currentSkillToken(field);
+        if (!token) {
+            renderSkillSuggestions([]);
+            return;
+        }
+
+        const key = token.toLowerCase();
+        if (!skillSuggestionCache.has(key)) {
+            try {
+                const response = await fetch(`${API_BASE_URL}/skills/suggest?q=${encodeURIComponent(token)}`);
+                if (!response.ok) return;
+                const data = await response.json();
+                skillSuggestionCache.set(key, data.suggestions);
+            } catch (error) {
+                console.error('Skill suggestion error:', error);
+                return;
+            }
+        }
+
+        // Ignore answers for a token the user has already typed past
+        if (currentSkillToken(field) === token) {
+            const existing = resumeData.skills.split(',').map(s => s.trim().toLowerCase());
+            renderSkillSuggestions(skillSuggestionCache.get(key).filter(s => !existing.includes(s.toLowerCase())));
+        }
+    }, 120);
+}
+
+function renderSkillSuggestions(suggestions) {
+    const container = document.getElementById('skillsSuggestions');
+    container.innerHTML = '';
+    suggestions.forEach(skill => {
+        const button = document.createElement('button');
+        button.type = 'button';
+        button.className = 'skill-suggestion';
+        button.textContent = skill;
+        button.addEventListener('mousedown', event => {
+            event.preventDefault();
+            applySkillSuggestion(skill);
+        });
+        container.appendChild(button);
+    });
+}
+
+function applySkillSuggestion(skill) {
+    const field = document.getElementById('skills');
+    const caret = field.selectionStart;
+    const start = field.value.lastIndexOf(',', caret - 1) + 1;
+    let end = field.value.indexOf(',', caret);
+    if (end === -1) end = field.value.length;
+
+    const before = field.value.slice(0, start).trimEnd();
+    const after = field.value.slice(end);
+    const prefix = before ? `${before} ` : '';
+    field.value = `${prefix}${skill}${after || ', '}`;
+    const newCaret = prefix.length + skill.length + (after ? 0 : 2);
+    field.setSelectionRange(newCaret, newCaret);
+    field.focus();
+
+    renderSkillSuggestions([]);
+    updateResumeData();
+}
+
+async function normalizeSkills() {
+    const field = document.getElementById('skills');
+    if (!field.value.trim()) return;
+
+    try {
+        const response = await fetch(`${API_BASE_URL}/skills/normalize`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ skills: field.value })
+        });
+        if (!response.ok) return;
+        const data = await response.json();
+        if (data.text && data.text !== field.value) {
+            field.value = data.text;
+            updateResumeData();
+        }
+    } catch (error) {
+        console.error('Skill normalization error:', error);
+    }
+}
+
 function updateProjectsPreview() {
     ['modern', 'professional', 'executive', 'creative', 'minimalist', 'custom'].forEach(template => {
         const section = document.getElementById(`${template}Projects`);
@@ -851,6 +929,13 @@ function initializeEventListeners() {
             element.addEventListener('input', updateResumeData);
         }
     });
+
+    const skillsField = document.getElementById('skills');
+    if (skillsField) {
+        skillsField.addEventListener('input', suggestSkills);
+        skillsField.addEventListener('change', normalizeSkills);
+        skillsField.addEventListener('blur', () => renderSkillSuggestions([]));
+    }
 }
 
 document.addEventListener('DOMContentLoaded', () => {
@@ -861,35 +946,128 @@ document.addEventListener('DOMContentLoaded', () => {
 });
 
 // LinkedIn Import Function
-async function importLinkedIn() {
-    const linkedinUrl = document.getElementById('linkedin').value;
-    
-    if (!linkedinUrl) {
-        const url = prompt('Enter your LinkedIn profile URL:');
-        if (!url) return;
-        document.getElementById('linkedin').value = url;
-    }
-    
-    showToast('LinkedIn import feature coming soon! For now, manually enter your information or paste your LinkedIn summary into the Professional Summary field and use AI enhancement.', 'info');
-    
-    // Future implementation would make API call
-    /*
+function importLinkedIn() {
+    document.getElementById('linkedinFile').click();
+}
+
+async function uploadLinkedInExport(input) {
+    const file = input.files[0];
+    if (!file) return;
+
+    const formData = new FormData();
+    formData.append('file', file);
+
     try {
+        showLoading(true);
         const response = await fetch(`${API_BASE_URL}/import_linkedin`, {
             method: 'POST',
-            headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ linkedin_url: linkedinUrl })
+            body: formData
         });
-        
-        if (response.ok) {
-            const data = await response.json();
-            // Populate form fields with imported data
-            showToast('LinkedIn profile imported successfully!');
+        const data = await response.json();
+
+        if (!response.ok || !data.success) {
+            throw new Error(data.error || 'Import failed');
         }
+
+        populateResumeForm(data.resume);
+        showToast('LinkedIn profile imported successfully!');
     } catch (error) {
-        showToast('Error importing LinkedIn profile', 'error');
+        console.error('LinkedIn import error:', error);
+        showToast(`Error importing LinkedIn profile: ${error.message}`, 'error');
+    } finally {
+        input.value = '';
+        showLoading(false);
     }
-    */
+}
+
+// Existing Resume Import Function
+async function uploadExistingResume(input) {
+    const file = input.files[0];
+    if (!file) return;
+
+    const formData = new FormData();
+    formData.append('file', file);
+
+    try {
+        showLoading(true);
+        const response = await fetch(`${API_BASE_URL}/parse_resume`, {
+            method: 'POST',
+            body: formData
+        });
+        const data = await response.json();
+
+        if (!response.ok || !data.success) {
+            throw new Error(data.error || 'Import failed');
+        }
+
+        populateResumeForm(data.resume);
+        showToast('Resume imported! Review the fields and use AI enhancement where needed.');
+    } catch (error) {
+        console.error('Resume import error:', error);
+        showToast(`Error importing resume: ${error.message}`, 'error');
+    } finally {
+        input.value = '';
+        showLoading(false);
+    }
+}
+
+// Fill the form from a resumeData-shaped object, keeping fields that the
+// imported data leaves empty
+function populateResumeForm(data) {
+    Object.entries(data.personal || {}).forEach(([field, value]) => {
+        const element = document.getElementById(field);
+        if (element && value) element.value = value;
+    });
+    if (data.skills) document.getElementById('skills').value = data.skills;
+
+    if (data.experiences && data.experiences.length) {
+        document.getElementById('experienceContainer').innerHTML = '';
+        experienceCounter = 0;
+        data.experiences.forEach(exp => {
+            addExperience();
+            const item = document.querySelector('#experienceContainer .dynamic-item:last-child');
+            item.querySelector('.exp-title').value = exp.title || '';
+            item.querySelector('.exp-company').value = exp.company || '';
+            item.querySelector('.exp-start').value = exp.startDate || '';
+            item.querySelector('.exp-end').value = exp.endDate || '';
+            item.querySelector('.exp-description').value = exp.description || '';
+            if (exp.current) {
+                const checkbox = item.querySelector('.exp-current');
+                checkbox.checked = true;
+                item.querySelector('.exp-end').disabled = true;
+            }
+        });
+        updateExperienceData();
+    }
+
+    if (data.education && data.education.length) {
+        document.getElementById('educationContainer').innerHTML = '';
+        educationCounter = 0;
+        data.education.forEach(edu => {
+            addEducation();
+            const item = document.querySelector('#educationContainer .dynamic-item:last-child');
+            item.querySelector('.edu-degree').value = edu.degree || '';
+            item.querySelector('.edu-field').value = edu.field || '';
+            item.querySelector('.edu-institution').value = edu.institution || '';
+            item.querySelector('.edu-year').value = edu.year || '';
+            item.querySelector('.edu-details').value = edu.details || '';
+        });
+        updateEducationData();
+    }
+
+    if (data.projectsList && data.projectsList.length) {
+        document.getElementById('projectsContainer').innerHTML = '';
+        projectCounter = 0;
+        data.projectsList.forEach(project => {
+            addProject();
+            const item = document.querySelector('#projectsContainer .dynamic-item:last-child');
+            item.querySelector('.proj-title').value = project.title || '';
+            item.querySelector('.proj-description').value = project.description || '';
+        });
+        updateProjectData();
+    }
+
+    updateResumeData();
 }
 
 // Resume Analysis Function
@@ -899,31 +1077,21 @@ async function analyzeResume() {
     btn.textContent = 'Analyzing...';
     
     try {
-        // Collect all resume data
-        const resumeContent = {
-            personalInfo: {
-                fullName: document.getElementById('fullName').value,
-                email: document.getElementById('email').value,
-                phone: document.getElementById('phone').value,
-                linkedin: document.getElementById('linkedin').value,
-                summary: document.getElementById('summary').value
-            },
-            experience: resumeData.experiences,
-            education: resumeData.education,
-            skills: document.getElementById('skills').value.split(',').map(s => s.trim()).filter(s => s)
-        };
-        
+        // Sync form fields and send the same resumeData shape used for generation
+        updateResumeData();
+
         const response = await fetch(`${API_BASE_URL}/analyze_resume`, {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify(resumeContent)
+            body: JSON.stringify(resumeData)
         });
         
+        const analysis = await response.json();
         if (!response.ok) {
-            throw new Error('Analysis failed');
+            showToast(analysis.error || 'Analysis failed. Please try again.', 'error');
+            return;
         }
-        
-        const analysis = await response.json();
+
         displayAnalysisResults(analysis);
         showToast('Resume analysis complete!');
         
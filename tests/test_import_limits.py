@@ -0,0 +1,87 @@
+"""Tests that imported resumes always fit the resume model's limits.
+
+Whatever /import_linkedin or /parse_resume extracts must be accepted as is
+by /generate_resume.
+
+Usage:
+    python -m pytest tests
+"""
+import csv
+import io
+import os
+import sys
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import app  # noqa: E402
+
+
+def csv_member(rows):
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue()
+
+
+def linkedin_export(positions=40, skills=400):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zf:
+        zf.writestr('Profile.csv', csv_member([{
+            'First Name': 'Jane', 'Last Name': 'Doe', 'Geo Location': 'Berlin',
+            'Summary': 'Builds things. ' * 1000}]))
+        zf.writestr('Positions.csv', csv_member([{
+            'Company Name': f'Company {i}', 'Title': 'Engineer ' * 50, 'Started On': 'Jan 2015',
+            'Finished On': '', 'Description': 'Shipped features. ' * 600} for i in range(positions)]))
+        zf.writestr('Skills.csv', csv_member([{'Name': f'Skill number {i}'} for i in range(skills)]))
+    buffer.seek(0)
+    return buffer
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    monkeypatch.setattr(app, 'state', app.LocalStateBackend(str(tmp_path), str(tmp_path / 'state.db')))
+    return app.app.test_client()
+
+
+def test_large_linkedin_export_can_be_generated(client):
+    response = client.post('/import_linkedin', data={'file': (linkedin_export(), 'export.zip')},
+                           content_type='multipart/form-data')
+    assert response.status_code == 200
+    resume = response.get_json()['resume']
+
+    assert 0 < len(resume['experiences']) <= app.RESUME_MAX_ENTRIES
+    assert len(resume['experiences'][0]['description']) <= app.LONG_FIELD_CHARS
+    assert len(resume['experiences'][0]['title']) <= app.SHORT_FIELD_CHARS
+    assert len(resume['personal']['summary']) <= app.LONG_FIELD_CHARS
+    assert len(resume['skills'].split(', ')) <= app.RESUME_MAX_SKILLS
+
+    assert app._encoded_size(resume) <= app.IMPORTED_RESUME_BYTES
+    assert client.post('/generate_resume', json=resume).status_code == 200
+
+
+def test_small_linkedin_export_keeps_every_entry(client):
+    response = client.post('/import_linkedin', data={'file': (linkedin_export(positions=3, skills=5), 'export.zip')},
+                           content_type='multipart/form-data')
+    resume = response.get_json()['resume']
+
+    assert [e['company'] for e in resume['experiences']] == ['Company 0', 'Company 1', 'Company 2']
+    assert resume['skills'] == ', '.join(f'Skill number {i}' for i in range(5))
+
+
+def test_parsed_resume_sections_fit_the_model():
+    sections = {
+        'Name': 'Jane Doe',
+        'Work Experience': '\n\n'.join(f"Engineer | Company {i} | 2015 - 2020\n{'Did work. ' * 100}"
+                                       for i in range(40)),
+        'Skills': ', '.join(f'Skill {i}' for i in range(300)),
+    }
+
+    resume = app.sections_to_resume_data(sections)
+
+    decoded = app.decode_resume(resume)
+    assert len(decoded.experiences) == app.RESUME_MAX_ENTRIES
+    assert len(decoded.skills) <= app.RESUME_MAX_SKILLS
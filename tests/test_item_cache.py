@@ -0,0 +1,72 @@
+"""Tests for the per-item enhancement cache.
+
+The Groq client is replaced by a stand-in that counts calls, and the state
+backend by a fresh local one, so no API key or shared cache is needed.
+
+Usage:
+    python -m pytest tests
+"""
+import json
+import os
+import sys
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import app  # noqa: E402
+
+
+class CountingClient:
+    """Answers every project prompt with an enhanced version of its input."""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=self)
+
+    def create(self, messages, **params):
+        with self._lock:
+            self.calls += 1
+        project = messages[-1]["content"].split("Project:\n", 1)[1]
+        title = project.split("\n", 1)[0].removeprefix("Title: ")
+        content = json.dumps({"title": title, "description": f"Led {title} to launch."})
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture
+def llm(monkeypatch, tmp_path):
+    client = CountingClient()
+    monkeypatch.setattr(app, 'client', client)
+    monkeypatch.setattr(app, 'state', app.LocalStateBackend(str(tmp_path), str(tmp_path / 'state.db')))
+    return client
+
+
+def enhance(items):
+    return app.enhance_items("projects", items, deadline=app.time.monotonic() + 30)
+
+
+def test_unchanged_items_are_cache_hits(llm):
+    items = [{"title": f"Project {i}", "description": f"Built thing {i}"} for i in range(10)]
+
+    first = enhance(items)
+    second = enhance(items)
+
+    assert llm.calls == 10
+    assert all(item["cached"] for item in second)
+    assert [item["description"] for item in second] == [item["description"] for item in first]
+
+
+def test_editing_one_enhanced_item_costs_one_call(llm):
+    items = [{"title": f"Project {i}", "description": f"Built thing {i}"} for i in range(10)]
+    enhanced = [{k: v for k, v in item.items() if k != "cached"} for item in enhance(items)]
+    assert llm.calls == 10
+
+    enhanced[3]["description"] = "Rewrote it by hand"
+    again = enhance(enhanced)
+
+    assert llm.calls == 11
+    assert [item["cached"] for item in again] == [i != 3 for i in range(10)]
+    assert again[0]["description"] == enhanced[0]["description"]
@@ -0,0 +1,204 @@
+"""Tests for the shared state backends.
+
+The Redis backend runs against a minimal in-process RESP server that
+implements only the commands the app uses (GET, SET [EX], INCR, EXPIRE,
+AUTH, SELECT), so no Redis install is needed.
+
+Usage:
+    python -m pytest tests
+"""
+import os
+import socketserver
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import app  # noqa: E402
+
+
+class RespStandIn(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), RespHandler)
+        self.data = {}
+        self.expires = {}
+        self.commands = []
+
+    def get(self, key):
+        if key in self.expires and self.expires[key] <= time.time():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return self.data.get(key)
+
+
+class RespHandler(socketserver.StreamRequestHandler):
+    def read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:])):
+            length = int(self.rfile.readline()[1:])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def handle(self):
+        server = self.server
+        while True:
+            args = self.read_command()
+            if args is None:
+                return
+            command = args[0].upper().decode()
+            server.commands.append(command)
+            if command in ('AUTH', 'SELECT'):
+                reply = b'+OK\r\n'
+            elif command == 'SET':
+                server.data[args[1]] = args[2]
+                server.expires.pop(args[1], None)
+                if len(args) == 5 and args[3].upper() == b'EX':
+                    server.expires[args[1]] = time.time() + int(args[4])
+                reply = b'+OK\r\n'
+            elif command == 'GET':
+                value = server.get(args[1])
+                reply = b'$-1\r\n' if value is None else b'$%d\r\n%s\r\n' % (len(value), value)
+            elif command == 'INCR':
+                count = int(server.get(args[1]) or 0) + 1
+                server.data[args[1]] = str(count).encode()
+                reply = b':%d\r\n' % count
+            elif command == 'EXPIRE':
+                server.expires[args[1]] = time.time() + int(args[2])
+                reply = b':1\r\n'
+            else:
+                reply = b"-ERR unknown command '%s'\r\n" % command.encode()
+            self.wfile.write(reply)
+
+
+@pytest.fixture
+def resp_server():
+    server = RespStandIn()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def redis_url(resp_server):
+    return f"redis://:secret@127.0.0.1:{resp_server.server_address[1]}/2"
+
+
+def write_artifact(directory, name, content=b'resume bytes'):
+    path = os.path.join(directory, name)
+    with open(path, 'wb') as f:
+        f.write(content)
+    return path
+
+
+def test_resp_client_round_trips_and_pools_connections(resp_server, redis_url):
+    client = app.RespClient(redis_url)
+
+    assert client.execute('SET', 'k', b'\x00binary\r\n') == 'OK'
+    assert client.execute('GET', 'k') == b'\x00binary\r\n'
+    assert client.execute('GET', 'missing') is None
+    assert client.execute('INCR', 'n') == 1
+    assert client.execute('INCR', 'n') == 2
+    # AUTH and SELECT run once, on the single pooled connection
+    assert resp_server.commands.count('AUTH') == 1
+    assert resp_server.commands.count('SELECT') == 1
+
+
+def test_resp_client_errors_raise_state_backend_error(resp_server, redis_url):
+    client = app.RespClient(redis_url)
+    with pytest.raises(app.StateBackendError, match='unknown command'):
+        client.execute('FLUSHALL')
+    # The connection stays usable after an error reply
+    assert client.execute('SET', 'k', 'v') == 'OK'
+
+
+def test_resp_client_unreachable_server():
+    client = app.RespClient('redis://127.0.0.1:1/0', timeout=0.5)
+    with pytest.raises(app.StateBackendError, match='Cannot connect'):
+        client.execute('GET', 'k')
+
+
+def test_redis_backend_artifacts(resp_server, redis_url, tmp_path):
+    backend = app.RedisStateBackend(redis_url, prefix='test:', artifact_ttl=60)
+    path = write_artifact(tmp_path, 'Resume_0123abcd.pdf')
+
+    meta = backend.save_artifact(path, 'pdf')
+
+    assert not os.path.exists(path)
+    assert backend.artifact_info('Resume_0123abcd.pdf') == meta
+    assert backend.artifact_info('Resume_00000000.pdf') is None
+    assert backend.open_artifact('Resume_0123abcd.pdf').read() == b'resume bytes'
+    assert resp_server.expires[b'test:artifact:Resume_0123abcd.pdf'] > time.time()
+    assert not any(b'latest' in key for key in resp_server.data)
+
+
+def test_redis_backend_cache_and_counters(resp_server, redis_url):
+    backend = app.RedisStateBackend(redis_url, prefix='test:')
+
+    backend.cache_set('item:abc', '{"title": "T"}', 60)
+    assert backend.cache_get('item:abc') == '{"title": "T"}'
+    assert backend.cache_get('item:missing') is None
+
+    assert [backend.incr('ratelimit:llm:1.2.3.4', 60) for _ in range(3)] == [1, 2, 3]
+    assert resp_server.commands.count('EXPIRE') == 1
+
+
+def test_local_backend_is_lazy_and_expires_artifacts(tmp_path):
+    artifact_dir = str(tmp_path / 'generated')
+    backend = app.LocalStateBackend(artifact_dir, os.path.join(artifact_dir, 'state.db'), artifact_ttl=60)
+    assert not os.path.exists(artifact_dir)
+
+    os.makedirs(artifact_dir)
+    old = backend.save_artifact(write_artifact(artifact_dir, 'Resume_00000000.docx'), 'docx')
+    with backend._locked_db() as db:
+        db.execute("UPDATE artifacts SET created_at = ? WHERE name = ?", (time.time() - 120, old["name"]))
+    assert backend.artifact_info(old["name"]) is None
+
+    backend._last_purge = 0.0
+    new = backend.save_artifact(write_artifact(artifact_dir, 'Resume_11111111.docx'), 'docx')
+    assert backend.artifact_info(new["name"]) == new
+    assert not os.path.exists(os.path.join(artifact_dir, old["name"]))
+    assert backend.open_artifact(old["name"]) is None
+
+
+def test_state_backend_is_abstract():
+    with pytest.raises(TypeError):
+        app.StateBackend()
+
+
+def test_downloads_require_the_artifact_name(monkeypatch, tmp_path):
+    backend = app.LocalStateBackend(str(tmp_path), str(tmp_path / 'state.db'))
+    monkeypatch.setattr(app, 'state', backend)
+    meta = backend.save_artifact(write_artifact(tmp_path, 'Resume_2222aaaa.pdf', b'%PDF-1.4 x' * 1000), 'pdf')
+    client = app.app.test_client()
+
+    assert client.get('/download_pdf').status_code == 400
+    assert client.get('/download_pdf?name=Resume_3333bbbb.pdf').status_code == 404
+
+    response = client.get(f'/download_pdf?name={meta["name"]}')
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.get_data() == b'%PDF-1.4 x' * 1000
+    response.close()
+    assert client.get(f'/download_pdf?name={meta["name"]}',
+                      headers={'If-None-Match': f'"{meta["etag"]}"'}).status_code == 304
+
+
+def test_local_backend_wraps_sqlite_errors(tmp_path):
+    backend = app.LocalStateBackend(str(tmp_path), str(tmp_path / 'state.db'))
+    assert backend.incr('ratelimit:llm:x', 60) == 1
+    backend._connection().close()
+    with pytest.raises(app.StateBackendError):
+        backend.incr('ratelimit:llm:x', 60)
+    with pytest.raises(app.StateBackendError):
+        backend.cache_get('item:abc')